@@ -10,11 +10,15 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+import sys
+import threading
+import time
 from datetime import datetime, timedelta
 from functools import wraps
 from typing import Any, Dict, List, Optional, TypeVar, Union, Callable, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 try:
     import xbmc
@@ -105,9 +109,56 @@ def cached(cache_type: str = 'default'):
 def log(message, level=xbmc.LOGINFO):
     xbmc.log(f"{ADDON_ID}: {message}", level=level)
 
-def cached(key, func, ttl=None):
+# Cache keys with a background refresh in flight
+_REVALIDATING = set()
+_REVALIDATING_LOCK = threading.Lock()
+
+def _write_cache_text(path, text):
+    """
+    Atomically replace a cache file so readers never see a partial write
+    """
+    # Per-thread temp name: a background refresh may write the same key concurrently
+    tmp_path = f'{path}.{threading.get_ident()}.tmp'
+    with open(tmp_path, 'w') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+def _served_folder_path():
+    """
+    Container.FolderPath of the listing being built: this plugin call's own URL,
+    or the current container when not running as a directory plugin.
+    """
+    if len(sys.argv) > 2 and sys.argv[0].startswith('plugin://'):
+        return sys.argv[0] + sys.argv[2]
+    return xbmc.getInfoLabel('Container.FolderPath')
+
+def _revalidate(key, path, func, old_text, folder_path):
+    """
+    Refetch a stale cache entry in the background. If the data changed and
+    the listing it was served to (folder_path) is still showing, refresh it.
+    Empty results keep the stale entry.
+    """
+    try:
+        result = func()
+        if not result:
+            return
+        new_text = json.dumps(result, separators=(',', ':'))
+        _write_cache_text(path, new_text)
+        # The user may have moved on to another listing, a dialog or playback
+        if new_text != old_text and xbmc.getInfoLabel('Container.FolderPath') == folder_path:
+            xbmc.executebuiltin('Container.Refresh')
+    except Exception as e:
+        log(f"Error refreshing cache {key}: {e}", xbmc.LOGWARNING)
+    finally:
+        with _REVALIDATING_LOCK:
+            _REVALIDATING.discard(key)
+
+def cached(key, func, ttl=None, stale_after=None):
     """
     Cache the result of a function call
+
+    With stale_after set, entries older than stale_after (but younger than ttl)
+    are returned immediately and refreshed on a background thread.
     """
     if ttl is None:
         try:
@@ -125,18 +176,27 @@ def cached(key, func, ttl=None):
     path = os.path.join(CACHE_DIR, f"{key}.json")
 
     # Check if cache exists and is valid
-    if os.path.exists(path) and time.time() - os.path.getmtime(path) < ttl:
-        try:
-            with open(path, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            log(f"Error reading cache: {e}", xbmc.LOGWARNING)
+    if os.path.exists(path):
+        age = time.time() - os.path.getmtime(path)
+        if age < ttl:
+            try:
+                with open(path, 'r') as f:
+                    text = f.read()
+                data = json.loads(text)
+                if stale_after is not None and age >= stale_after:
+                    with _REVALIDATING_LOCK:
+                        start = key not in _REVALIDATING
+                        _REVALIDATING.add(key)
+                    if start:
+                        threading.Thread(target=_revalidate, args=(key, path, func, text, _served_folder_path()), name='CacheRevalidate').start()
+                return data
+            except Exception as e:
+                log(f"Error reading cache: {e}", xbmc.LOGWARNING)
 
     # Call the function and cache the result
     result = func()
     try:
-        with open(path, 'w') as f:
-            json.dump(result, f)
+        _write_cache_text(path, json.dumps(result, separators=(',', ':')))
     except Exception as e:
         log(f"Error writing cache: {e}", xbmc.LOGWARNING)
 
@@ -166,6 +226,22 @@ def clear_all_caches() -> bool:
         log(f"Error clearing cache: {e}", xbmc.LOGERROR)
         return False
 
+# One keep-alive session shared by every AnimeDBAPI instance
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+def get_session() -> requests.Session:
+    """Return the shared keep-alive session. Callers do their own retry/backoff."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _SESSION = session
+        return _SESSION
+
 class AnimeDBAPI:
     """Unified API interface for anime metadata, watchlists, and details from AniList, MyAnimeList, and Trakt.
 
@@ -378,6 +454,11 @@ class AnimeDBAPI:
         if self.debug or level != xbmc.LOGDEBUG:
             log(message, level)
 
+    @property
+    def session(self) -> requests.Session:
+        """Shared keep-alive HTTP session used for all service requests."""
+        return get_session()
+
     # AniList API methods
 
     def _get_anilist_token(self):
@@ -455,7 +536,7 @@ class AnimeDBAPI:
                     xbmc.sleep(int(wait_time * 1000))
                 
                 # Make the request
-                response = requests.post(
+                response = self.session.post(
                     ANILIST_API,
                     headers=headers,
                     json=data,
@@ -610,7 +691,7 @@ class AnimeDBAPI:
         while retry_count <= max_retries:
             try:
                 # Make the request
-                response = requests.request(
+                response = self.session.request(
                     method=method,
                     url=url,
                     params=params,
@@ -760,7 +841,7 @@ class AnimeDBAPI:
         while retry_count <= max_retries:
             try:
                 # Make the request
-                response = requests.request(
+                response = self.session.request(
                     method=method,
                     url=url,
                     params=params,
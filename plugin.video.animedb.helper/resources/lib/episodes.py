@@ -67,8 +67,8 @@ def list_episodes(handle: int, anime_id: str, source: str = 'anilist', title: Op
             xbmcplugin.endOfDirectory(handle)
         return
     
-    # Get watched episodes and progress
-    watched_episodes = get_watched_episodes(anime_id, source)
+    # Get watched episodes and progress; a set so per-episode membership tests are O(1)
+    watched_episodes = set(get_watched_episodes(anime_id, source))
     
     # Try TMDB integration first
     from resources.lib.tmdb_bridge import get_tmdb_episodes
@@ -138,6 +138,8 @@ def list_episodes(handle: int, anime_id: str, source: str = 'anilist', title: Op
     if source == 'anilist':
         episode_details = api.anilist_episodes(anime_id)
     episode_map = {ep['number']: ep for ep in episode_details if ep.get('number')}
+    # Series-level poster URL used as an episode thumbnail fallback, built once
+    tmdb_poster = tmdb_api.IMAGE_BASE + tmdb_meta['poster_path'] if tmdb_meta and tmdb_meta.get('poster_path') else ''
     # Create a list item for each episode
     for episode_num in range(1, total_episodes + 1):
         # Prefer TMDB episode data if available
@@ -146,11 +148,10 @@ def list_episodes(handle: int, anime_id: str, source: str = 'anilist', title: Op
             episode_title = tmdb_ep.get('name') or f"Episode {episode_num}"
             episode_plot = tmdb_ep.get('overview') or (tmdb_meta and tmdb_meta.get('overview')) or details.get('description', '')
             episode_thumb = ''
-            if tmdb_ep.get('still_path'):
-                from resources.lib.tmdb import TMDBAPI
-                episode_thumb = TMDBAPI.IMAGE_BASE + tmdb_ep['still_path']
-            elif tmdb_meta and tmdb_meta.get('poster_path'):
-                episode_thumb = tmdb_api.IMAGE_BASE + tmdb_meta['poster_path']
+            if tmdb_ep.get('_image_url'):
+                episode_thumb = tmdb_ep['_image_url']
+            elif tmdb_poster:
+                episode_thumb = tmdb_poster
             else:
                 episode_thumb = details.get('poster', '') or details.get('banner', '')
             air_date = tmdb_ep.get('air_date')
@@ -159,7 +160,7 @@ def list_episodes(handle: int, anime_id: str, source: str = 'anilist', title: Op
             ep = episode_map.get(episode_num, {})
             episode_title = ep.get('title') or f"Episode {episode_num}"
             episode_plot = ep.get('description') or (tmdb_meta and tmdb_meta.get('overview')) or details.get('description', '')
-            episode_thumb = ep.get('thumbnail') or (tmdb_meta and tmdb_meta.get('poster_path') and tmdb_api.IMAGE_BASE + tmdb_meta['poster_path']) or details.get('poster', '') or details.get('banner', '')
+            episode_thumb = ep.get('thumbnail') or tmdb_poster or details.get('poster', '') or details.get('banner', '')
             air_date = None
             if ep.get('air_date'):
                 try:
@@ -168,7 +169,7 @@ def list_episodes(handle: int, anime_id: str, source: str = 'anilist', title: Op
                 except Exception:
                     air_date = None
             duration = ep.get('duration')
-        li = xbmcgui.ListItem(episode_title)
+        li = xbmcgui.ListItem(episode_title, offscreen=True)
         info_tag = li.getVideoInfoTag()
         info_tag.setTitle(episode_title)
         info_tag.setTvShowTitle(tmdb_meta['name'] if tmdb_meta and tmdb_meta.get('name') else details.get('title', ''))
@@ -123,7 +123,7 @@ def list_show_seasons(handle, anime_id, source, show_details_anilist, tmdb_show_
         fanart_path = tmdb_show_details.get("backdrop_path")
         
         # Create list item
-        li = xbmcgui.ListItem(season_name)
+        li = xbmcgui.ListItem(season_name, offscreen=True)
         
         # Set art
         art = {}
@@ -260,7 +260,7 @@ def list_episodes_for_season(handle, anime_id, source, season_number, show_detai
                 episode_number = episode.get("number", 0)
                 episode_title = episode.get("title", f"Episode {episode_number}")
                 
-                li = xbmcgui.ListItem(f"{episode_number}. {episode_title}")
+                li = xbmcgui.ListItem(f"{episode_number}. {episode_title}", offscreen=True)
                 
                 # Set art
                 thumb = episode.get("thumbnail", "")
@@ -306,7 +306,7 @@ def list_episodes_for_season(handle, anime_id, source, season_number, show_detai
                 episode_number = episode.get("episode_number", 0)
                 episode_title = episode.get("name", f"Episode {episode_number}")
                 
-                li = xbmcgui.ListItem(f"{episode_number}. {episode_title}")
+                li = xbmcgui.ListItem(f"{episode_number}. {episode_title}", offscreen=True)
                 
                 # Set art
                 still_path = episode.get("still_path")
@@ -1,6 +1,9 @@
 import os
 import requests
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import xbmcaddon
 import xbmcvfs
 import xbmc
@@ -14,23 +17,54 @@ PROFILE = xbmcvfs.translatePath(ADDON.getAddonInfo('profile'))
 ART_CACHE_DIR = os.path.join(PROFILE, 'art_cache')
 os.makedirs(ART_CACHE_DIR, exist_ok=True)
 
+# Artwork rarely changes, so cached entries are trusted for a week
+ART_CACHE_TTL = 7 * 86400
+
+# Most AniList ids requested per GraphQL page in fetch_art_batch
+ANILIST_BATCH_SIZE = 50
+
 # Logging function
 def log(message, level=xbmc.LOGINFO):
     xbmc.log(f"{ADDON_ID}: {message}", level=level)
 
+class ArtUnavailable(Exception):
+    """Raised by _fetch_art when the source returned no artwork at all"""
+
 def fetch_art(anime_id, source='anilist'):
     """
     Fetch artwork for an anime
     """
+    try:
+        # Copy so callers can fill in fallbacks without touching the memoized dict
+        return dict(_fetch_art(str(anime_id), source))
+    except ArtUnavailable:
+        return {
+            'poster': '',
+            'fanart': '',
+            'banner': '',
+            'clearlogo': ''
+        }
+    except Exception as e:
+        log(f"Error fetching art: {e}", xbmc.LOGWARNING)
+        return {
+            'poster': '',
+            'fanart': '',
+            'banner': '',
+            'clearlogo': ''
+        }
+
+@lru_cache(maxsize=4096)
+def _fetch_art(anime_id, source):
+    """
+    Load artwork from the disk cache or the source API, memoized for the process.
+    The fetchers swallow request errors and return empty values, so an all-empty
+    result raises ArtUnavailable instead of being memoized or written to disk.
+    """
     # Check cache first
-    cache_file = os.path.join(ART_CACHE_DIR, f"{source}_{anime_id}.json")
-    
-    if os.path.exists(cache_file):
-        try:
-            with open(cache_file, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            log(f"Error reading art cache: {e}", xbmc.LOGWARNING)
+    cache_file = _art_cache_file(anime_id, source)
+    art = _read_art_cache(cache_file)
+    if art is not None:
+        return art
     
     # Default art
     art = {
@@ -41,23 +75,95 @@ def fetch_art(anime_id, source='anilist'):
     }
     
     # Fetch from API
+    if source == 'anilist':
+        art = fetch_anilist_art(anime_id)
+    elif source == 'mal':
+        art = fetch_mal_art(anime_id)
+    elif source == 'trakt':
+        art = fetch_trakt_art(anime_id)
+    
+    if not any(art.values()):
+        raise ArtUnavailable(f"{source}_{anime_id}")
+    
+    # Cache result
+    _write_art_cache(cache_file, art)
+    
+    return art
+
+def _art_cache_file(anime_id, source):
+    """
+    Path of the disk cache entry for one anime's artwork
+    """
+    return os.path.join(ART_CACHE_DIR, f"{source}_{anime_id}.json")
+
+def _read_art_cache(cache_file):
+    """
+    Return cached artwork if the entry exists, is fresh and has any artwork, else None
+    """
     try:
-        if source == 'anilist':
-            art = fetch_anilist_art(anime_id)
-        elif source == 'mal':
-            art = fetch_mal_art(anime_id)
-        elif source == 'trakt':
-            art = fetch_trakt_art(anime_id)
-        
-        # Cache result
-        with open(cache_file, 'w') as f:
-            json.dump(art, f)
-        
-        return art
+        if time.time() - os.path.getmtime(cache_file) < ART_CACHE_TTL:
+            with open(cache_file, 'r') as f:
+                art = json.load(f)
+            # Entries written before empty results were skipped may pin a failed fetch
+            if any(art.values()):
+                return art
+    except OSError:
+        pass
+    except ValueError as e:
+        log(f"Error reading art cache: {e}", xbmc.LOGWARNING)
+    return None
+
+def _write_art_cache(cache_file, art):
+    """
+    Atomically write artwork to the disk cache; the service and plugin read it concurrently
+    """
+    from resources.lib.api import _write_cache_text
+    try:
+        _write_cache_text(cache_file, json.dumps(art, separators=(',', ':')))
+    except OSError as e:
+        log(f"Error writing art cache: {e}", xbmc.LOGWARNING)
+
+def fetch_art_batch(pairs):
+    """
+    Fetch artwork for many (anime_id, source) pairs at once.
+    Uncached AniList entries are loaded with one GraphQL request per
+    ANILIST_BATCH_SIZE ids; other sources are fetched concurrently.
+    Returns a dict keyed by (str(anime_id), source).
+    """
+    results = {}
+    anilist_missing = []
+    other = []
+    for anime_id, source in pairs:
+        key = (str(anime_id), source)
+        if key in results:
+            continue
+        if source != 'anilist':
+            other.append(key)
+            continue
+        art = _read_art_cache(_art_cache_file(*key))
+        if art is None:
+            anilist_missing.append(key[0])
+        else:
+            results[key] = art
     
-    except Exception as e:
-        log(f"Error fetching art: {e}", xbmc.LOGWARNING)
-        return art
+    for start in range(0, len(anilist_missing), ANILIST_BATCH_SIZE):
+        chunk = anilist_missing[start:start + ANILIST_BATCH_SIZE]
+        try:
+            fetched = fetch_anilist_art_batch(chunk)
+        except Exception as e:
+            log(f"Error fetching art batch: {e}", xbmc.LOGWARNING)
+            continue
+        for anime_id, art in fetched.items():
+            if any(art.values()):
+                _write_art_cache(_art_cache_file(anime_id, 'anilist'), art)
+            results[(anime_id, 'anilist')] = art
+    
+    if other:
+        with ThreadPoolExecutor(max_workers=min(8, len(other))) as executor:
+            for key, art in zip(other, executor.map(lambda key: fetch_art(*key), other)):
+                results[key] = art
+    
+    return results
 
 def fetch_anilist_art(anime_id):
     """
@@ -83,6 +189,40 @@ def fetch_anilist_art(anime_id):
         'clearlogo': ''
     }
 
+def fetch_anilist_art_batch(anime_ids):
+    """
+    Fetch artwork for several AniList ids with a single GraphQL request.
+    Returns a dict keyed by str(anime_id); ids AniList doesn't return are omitted.
+    """
+    from resources.lib.api import AnimeDBAPI
+    api = AnimeDBAPI()
+    
+    query = '''
+    query ($ids: [Int], $perPage: Int) {
+      Page(perPage: $perPage) {
+        media(id_in: $ids, type: ANIME) {
+          id
+          coverImage { large medium }
+          bannerImage
+        }
+      }
+    }'''
+    data = api._anilist_query(query, {'ids': [int(anime_id) for anime_id in anime_ids], 'perPage': len(anime_ids)})
+    if not data or 'errors' in data:
+        return {}
+    
+    results = {}
+    for media in data.get('data', {}).get('Page', {}).get('media', []):
+        cover = media.get('coverImage') or {}
+        banner = media.get('bannerImage') or ''
+        results[str(media.get('id'))] = {
+            'poster': cover.get('large') or cover.get('medium') or '',
+            'fanart': banner,
+            'banner': banner,
+            'clearlogo': ''
+        }
+    return results
+
 def fetch_mal_art(anime_id):
     """
     Fetch artwork from MyAnimeList
@@ -137,6 +277,7 @@ def clear_art_cache():
     """
     Clear artwork cache
     """
+    _fetch_art.cache_clear()
     for file in os.listdir(ART_CACHE_DIR):
         try:
             os.remove(os.path.join(ART_CACHE_DIR, file))
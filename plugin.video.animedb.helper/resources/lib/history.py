@@ -170,6 +170,53 @@ def get_watch_history(limit=100):
         log(f"Error getting watch history: {e}", xbmc.LOGERROR)
         return []
 
+def get_watch_history_by_anime(anime_id, episode=None):
+    """
+    Get watch history for a single anime, optionally for one episode.
+    Uses the (anime_id, episode, source) primary key index instead of scanning all history.
+    """
+    if not ADDON.getSettingBool('history_enabled'):
+        return []
+    
+    try:
+        conn = get_conn()
+        cur = conn.cursor()
+        if episode is None:
+            cur.execute(
+                '''
+                SELECT anime_id, episode, last_watch_time, source
+                FROM history
+                WHERE anime_id = ?
+                ORDER BY last_watch_time DESC
+                ''',
+                (str(anime_id),)
+            )
+        else:
+            cur.execute(
+                '''
+                SELECT anime_id, episode, last_watch_time, source
+                FROM history
+                WHERE anime_id = ? AND episode = ?
+                ORDER BY last_watch_time DESC
+                ''',
+                (str(anime_id), episode)
+            )
+        results = cur.fetchall()
+        conn.close()
+        
+        return [
+            {
+                'id': r[0],
+                'episode': r[1],
+                'last_watch_time': r[2],
+                'source': r[3]
+            } for r in results
+        ]
+    
+    except Exception as e:
+        log(f"Error getting watch history for {anime_id}: {e}", xbmc.LOGERROR)
+        return []
+
 def clear_history():
     """
     Clear watch history
@@ -9,6 +9,7 @@ import json
 import time
 import xbmc
 import xbmcgui
+import xbmcplugin
 import xbmcvfs
 from typing import Dict, List, Optional, Any, Set
 from datetime import datetime
@@ -3,6 +3,8 @@ search.py: Search functionality for AnimeDB Helper
 
 This module provides the UI and logic for searching anime across multiple sources.
 """
+import json
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 import xbmc
 import xbmcgui
 import xbmcplugin
@@ -10,38 +12,37 @@ from typing import Dict, List, Optional, Any, Tuple
 from urllib.parse import urlencode
 
 from resources.lib.api import AnimeDBAPI
-from resources.lib.ui import add_directory_item, ADDON, ADDON_ID
+from resources.lib.ui import build_directory_item, list_anime, ADDON, ADDON_ID
 
 # Get API instance
 API = AnimeDBAPI()
 
+# Worker for search requests so fast results can skip the progress dialog
+_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+# Seconds to wait for results before showing the progress dialog
+PROGRESS_DIALOG_DELAY = 0.15
+
+# Longest query kept in the search history
+MAX_QUERY_LENGTH = 128
+
+# Search menu entries: (params, label string id, icon)
+_MENU_ITEMS = (
+    ({'action': 'search_input'}, 32001, 'search.png'),  # New Search
+    ({'action': 'search_history'}, 32002, 'history.png'),  # Search History
+    ({'action': 'search_advanced'}, 32003, 'settings.png'),  # Advanced Search
+)
+
 def show_search_menu(handle: int) -> None:
     """Show the search menu with options for new search, history, and filters."""
-    # Add search option
-    add_directory_item(
-        handle,
-        ADDON.getLocalizedString(32001),  # New Search
-        {'action': 'search_input'},
-        'search.png'
-    )
-    
-    # Add search history
-    history = get_search_history()
-    if history:
-        add_directory_item(
-            handle,
-            ADDON.getLocalizedString(32002),  # Search History
-            {'action': 'search_history'},
-            'history.png'
-        )
-    
-    # Add advanced search
-    add_directory_item(
-        handle,
-        ADDON.getLocalizedString(32003),  # Advanced Search
-        {'action': 'search_advanced'},
-        'settings.png'
-    )
+    has_history = bool(get_search_history())
+    items = []
+    for params, string_id, icon in _MENU_ITEMS:
+        # Only offer search history when there is something to show
+        if params['action'] == 'search_history' and not has_history:
+            continue
+        items.append(build_directory_item(ADDON.getLocalizedString(string_id), params, icon))
+    xbmcplugin.addDirectoryItems(handle, items, len(items))
     
     xbmcplugin.endOfDirectory(handle)
 
@@ -54,7 +55,7 @@ def show_search_input(handle: int) -> None:
         xbmcplugin.endOfDirectory(handle)
         return
     
-    query = keyboard.getText().strip()
+    query = keyboard.getText()[:MAX_QUERY_LENGTH].strip()
     if not query:
         xbmcplugin.endOfDirectory(handle)
         return
@@ -78,23 +79,22 @@ def show_search_history(handle: int) -> None:
         return
     
     # Add clear history option
-    add_directory_item(
-        handle,
+    items = [build_directory_item(
         f'[COLOR red]{ADDON.getLocalizedString(32007)}[/COLOR]',  # Clear History
         {'action': 'clear_search_history'},
         'clear.png'
-    )
+    )]
     
     # Add history items
     for i, query in enumerate(history):
-        add_directory_item(
-            handle,
+        items.append(build_directory_item(
             query,
             {'action': 'search', 'query': query},
             'search_history.png',
             context_menu=[
                 (ADDON.getLocalizedString(32008), f'RunPlugin(plugin://{ADDON_ID}/?action=delete_search_history&index={i}')]  # Remove
-            )
+            ))
+    xbmcplugin.addDirectoryItems(handle, items, len(items))
     
     xbmcplugin.endOfDirectory(handle)
 
@@ -110,9 +110,7 @@ def perform_search(handle: int, query: str, filters: Optional[Dict[str, Any]] =
         xbmcplugin.endOfDirectory(handle)
         return
     
-    # Show busy dialog
-    dialog = xbmcgui.DialogProgressBG()
-    dialog.create(ADDON.getLocalizedString(32009), f'{ADDON.getLocalizedString(32010)}: {query}')  # Searching for
+    dialog = None
     
     try:
         # Get filters
@@ -122,8 +120,9 @@ def perform_search(handle: int, query: str, filters: Optional[Dict[str, Any]] =
         genres = filters.get('genres', []) if filters else []
         sort = filters.get('sort') if filters else 'SEARCH_MATCH'
         
-        # Perform search
-        results = API.search_anime(
+        # Perform search in the background
+        future = _EXECUTOR.submit(
+            API.search_anime,
             query=query,
             page=page,
             per_page=20,
@@ -133,9 +132,16 @@ def perform_search(handle: int, query: str, filters: Optional[Dict[str, Any]] =
             genres=genres,
             sort=sort
         )
-        
-        # Update progress
-        dialog.update(50, message=ADDON.getLocalizedString(32011))  # Processing results
+        try:
+            results = future.result(timeout=PROGRESS_DIALOG_DELAY)
+        except FutureTimeoutError:
+            # Only show the busy dialog for searches that are actually slow
+            dialog = xbmcgui.DialogProgressBG()
+            dialog.create(ADDON.getLocalizedString(32009), f'{ADDON.getLocalizedString(32010)}: {query}')  # Searching for
+            results = future.result()
+            
+            # Update progress
+            dialog.update(50, message=ADDON.getLocalizedString(32011))  # Processing results
         
         # Display results
         if not results:
@@ -148,8 +154,8 @@ def perform_search(handle: int, query: str, filters: Optional[Dict[str, Any]] =
             return
         
         # Add results to directory
-        from resources.lib.ui import list_anime
         list_anime(handle, results, title=f'Search: {query}')
+        xbmcplugin.endOfDirectory(handle)
         
     except Exception as e:
         xbmcgui.Dialog().notification(
@@ -159,14 +165,32 @@ def perform_search(handle: int, query: str, filters: Optional[Dict[str, Any]] =
         )
         xbmcplugin.endOfDirectory(handle)
     finally:
-        dialog.close()
+        if dialog:
+            dialog.close()
+
+def _fast_parse(history_json: str) -> Optional[List[str]]:
+    """
+    Parse a flat JSON list of plain strings without the JSON parser.
+    
+    Returns None when the string uses escapes or is not a simple string list,
+    in which case the caller should fall back to json.loads.
+    """
+    if history_json == '[]':
+        return []
+    if '\\' in history_json or history_json[:2] != '["' or history_json[-2:] != '"]':
+        return None
+    # Without escapes no element can contain a quote, so the separator is unambiguous
+    separator = '", "' if '", "' in history_json else '","'
+    return history_json[2:-2].split(separator)
 
 def get_search_history() -> List[str]:
     """Get the search history from settings."""
-    import json
     history_json = ADDON.getSetting('search_history')
     if not history_json:
         return []
+    history = _fast_parse(history_json)
+    if history is not None:
+        return history
     try:
         return json.loads(history_json)
     except (ValueError, TypeError):
@@ -174,7 +198,10 @@ def get_search_history() -> List[str]:
 
 def save_to_search_history(query: str) -> None:
     """Save a search query to the history."""
-    import json
+    query = query[:MAX_QUERY_LENGTH].strip()
+    if not query:
+        return
+    
     history = get_search_history()
     
     # Remove if already exists
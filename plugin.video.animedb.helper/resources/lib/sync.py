@@ -7,13 +7,17 @@ try:
 except ImportError:
     from resources.lib import xbmc, xbmcaddon, xbmcgui, xbmcplugin, xbmcvfs
 
-import time
 import threading
+import time
 import json
+import queue
+import traceback
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 from resources.lib.api import AnimeDBAPI
-from resources.lib.history import get_watch_history, record_watch
+from resources.lib.history import get_watch_history, get_watch_history_by_anime, record_watch
 from resources.lib.watchlist import get_local_watchlist as get_watchlist_items
 
 # Get addon instance
@@ -24,9 +28,75 @@ ADDON_ID = ADDON.getAddonInfo("id")
 def log(message, level=xbmc.LOGINFO):
     xbmc.log(f"{ADDON_ID}: {message}", level=level)
 
+# Boolean settings read by the sync code paths
+SYNC_SETTINGS = (
+    "sync_enabled", "sync_on_idle", "sync_watchlist", "sync_history", "sync_ratings",
+    "anilist_enabled", "mal_enabled", "trakt_enabled"
+)
+
+def _snapshot_settings():
+    """Read every sync-related boolean setting in a single pass.
+
+    Returns:
+        dict: Setting id mapped to its boolean value.
+    """
+    return {setting_id: ADDON.getSettingBool(setting_id) for setting_id in SYNC_SETTINGS}
+
 class SyncCancelled(Exception):
     pass
 
+class SettingsMonitor(xbmc.Monitor):
+    """Kodi monitor that flags the settings snapshot as stale when settings change."""
+    def __init__(self):
+        super().__init__()
+        self.settings_dirty = True
+
+    def onSettingsChanged(self):
+        self.settings_dirty = True
+
+def _sync_one_rating(service):
+    """Sync ratings for a single service.
+
+    Args:
+        service (str): Service to sync.
+
+    Returns:
+        int: Number of items synced.
+    """
+    # Placeholder for actual rating sync logic
+    log(f"Syncing ratings for {service}...", xbmc.LOGINFO)
+    return 1
+
+def _fetch_service_watchlists(api, services):
+    """Fetch the remote watchlist of every service concurrently.
+
+    Args:
+        api (AnimeDBAPI): API instance to fetch with.
+        services (list): List of services to fetch.
+
+    Returns:
+        dict: Service name mapped to its watchlist, or to the exception raised while fetching it.
+    """
+    fetchers = {
+        "anilist": api.anilist_watchlist,
+        "mal": api.mal_watchlist,
+        "trakt": api.trakt_watchlist
+    }
+    services = [service for service in services if service in fetchers]
+    watchlists = {}
+    if not services:
+        return watchlists
+
+    with ThreadPoolExecutor(max_workers=len(services)) as executor:
+        futures = {executor.submit(fetchers[service]): service for service in services}
+        for future in as_completed(futures):
+            service = futures[future]
+            try:
+                watchlists[service] = future.result()
+            except Exception as e:
+                watchlists[service] = e
+    return watchlists
+
 def sync_ratings(services, progress=None, progress_start=0, progress_range=20):
     """Sync ratings between services with progress tracking.
 
@@ -49,16 +119,16 @@ def sync_ratings(services, progress=None, progress_start=0, progress_range=20):
     if not services:
         return results
 
-    for service in services:
-        try:
-            # Placeholder for actual rating sync logic
-            log(f"Syncing ratings for {service}...", xbmc.LOGINFO)
-            # Simulate some work
-            time.sleep(1)
-            results["synced_items"] += 1
-        except Exception as e:
-            log(f"Error syncing ratings for {service}: {e}", xbmc.LOGERROR)
-            results["errors"].append({"service": service, "error": str(e)})
+    # Sync every service concurrently; results are merged here on the calling thread
+    with ThreadPoolExecutor(max_workers=len(services)) as executor:
+        futures = {executor.submit(_sync_one_rating, service): service for service in services}
+        for future in as_completed(futures):
+            service = futures[future]
+            try:
+                results["synced_items"] += future.result()
+            except Exception as e:
+                log(f"Error syncing ratings for {service}: {e}", xbmc.LOGERROR)
+                results["errors"].append({"service": service, "error": str(e)})
 
     if progress:
         progress.update(progress_start + progress_range, "Ratings Sync", "Ratings sync complete.")
@@ -82,20 +152,22 @@ def sync_all(progress_callback=None, cancel_flag=None):
     def is_cancelled():
         return cancel_flag.is_set() if cancel_flag else False
     
+    settings = _snapshot_settings()
+    
     # Get enabled services
     enabled_services = []
-    if ADDON.getSettingBool("anilist_enabled"):
+    if settings["anilist_enabled"]:
         enabled_services.append("anilist")
-    if ADDON.getSettingBool("mal_enabled"):
+    if settings["mal_enabled"]:
         enabled_services.append("mal")
-    if ADDON.getSettingBool("trakt_enabled"):
+    if settings["trakt_enabled"]:
         enabled_services.append("trakt")
     
     # Get sync settings
     # This was the line causing the TypeError: `sync_ratings = ADDON.getSettingBool("sync_ratings")`
     # It overwrote the function `sync_ratings` with a boolean value.
     # We should use a different variable name for the setting.
-    should_sync_ratings_setting = ADDON.getSettingBool("sync_ratings")
+    should_sync_ratings_setting = settings["sync_ratings"]
     
     if not enabled_services:
         log("No services enabled for sync", xbmc.LOGWARNING)
@@ -106,9 +178,9 @@ def sync_all(progress_callback=None, cancel_flag=None):
     current_step = 0
     
     # Count total steps for progress
-    if ADDON.getSettingBool("sync_watchlist"):
+    if settings["sync_watchlist"]:
         total_steps += 1
-    if ADDON.getSettingBool("sync_history"):
+    if settings["sync_history"]:
         total_steps += 1
     if should_sync_ratings_setting: # Use the new variable name here
         total_steps += 1
@@ -118,7 +190,7 @@ def sync_all(progress_callback=None, cancel_flag=None):
     
     try:
         # Sync watchlist if enabled
-        if ADDON.getSettingBool("sync_watchlist"):
+        if settings["sync_watchlist"]:
             if is_cancelled():
                 raise SyncCancelled("Sync cancelled by user during watchlist sync.")
                 
@@ -127,7 +199,7 @@ def sync_all(progress_callback=None, cancel_flag=None):
             current_step += 1
         
         # Sync history if enabled
-        if ADDON.getSettingBool("sync_history"):
+        if settings["sync_history"]:
             if is_cancelled():
                 raise SyncCancelled("Sync cancelled by user during history sync.")
                 
@@ -165,7 +237,6 @@ def sync_all(progress_callback=None, cancel_flag=None):
         return {"cancelled": True, "message": str(sc)}
     except Exception as e:
         log(f"Error during sync: {str(e)}", xbmc.LOGERROR)
-        import traceback
         log(traceback.format_exc(), xbmc.LOGERROR)
         return {"error": str(e)}
 
@@ -204,8 +275,17 @@ def sync_watchlists(services, progress=None, progress_start=0, progress_range=40
                 f"Processing {len(local_watchlist)} watchlist items..."
             )
         
+        # Fetch all service watchlists up front so the network waits overlap
+        service_watchlists = _fetch_service_watchlists(api, services)
+        
+        # Progress bar invariants; the dialog is only updated when the percentage changes
+        service_range = progress_range / len(services)
+        item_step = service_range / max(len(local_watchlist), 1)
+        last_pct = None
+        
         # Process each service
         for i, service in enumerate(services):
+            service_base = progress_start + i * service_range
             service_result = {
                 "items_processed": 0,
                 "items_added": 0,
@@ -215,26 +295,25 @@ def sync_watchlists(services, progress=None, progress_start=0, progress_range=40
             
             try:
                 # Get service watchlist
-                if service == "anilist":
-                    service_watchlist = api.anilist_watchlist()
-                elif service == "mal":
-                    service_watchlist = api.mal_watchlist()
-                elif service == "trakt":
-                    service_watchlist = api.trakt_watchlist()
-                else:
+                if service not in service_watchlists:
                     continue
+                service_watchlist = service_watchlists[service]
+                if isinstance(service_watchlist, Exception):
+                    raise service_watchlist
                 
                 # Process each item in local watchlist
                 for j, item in enumerate(local_watchlist):
                     try:
                         # Update progress
                         if progress:
-                            progress_pct = progress_start + int((i + j/len(local_watchlist)) * (progress_range/len(services)))
-                            progress.update(
-                                progress_pct,
-                                f"Syncing to {service.upper()}",
-                                f"Processing: {item.get('title', 'Unknown')}"
-                            )
+                            progress_pct = int(service_base + j * item_step)
+                            if progress_pct != last_pct:
+                                progress.update(
+                                    progress_pct,
+                                    f"Syncing to {service.upper()}",
+                                    f"Processing: {item.get('title', 'Unknown')}"
+                                )
+                                last_pct = progress_pct
                         
                         # Here you would implement the actual sync logic
                         # For now, we"ll just count the items
@@ -289,26 +368,18 @@ def sync_history(services, progress=None, progress_start=50, progress_range=40,
         return results
     
     try:
-        # Get watch history from local database
-        local_history = get_watch_history()
-        
-        # Filter for specific anime/episode if provided
+        # Get watch history from local database, using the indexed
+        # per-anime lookup when a specific anime/episode is requested
         if anime_id is not None:
-            if episode is not None:
-                # Filter for specific episode
-                local_history = [h for h in local_history 
-                               if h.get("anime_id") == anime_id 
-                               and h.get("episode") == episode]
-            else:
-                # Filter for all episodes of a specific anime
-                local_history = [h for h in local_history 
-                               if h.get("anime_id") == anime_id]
+            local_history = get_watch_history_by_anime(anime_id, episode)
             
             if not local_history:
                 log(f"No history found for anime_id: {anime_id}" + 
                     (f" episode: {episode}" if episode is not None else ""), 
                     xbmc.LOGWARNING)
                 return {"success": False, "message": "No matching history found"}
+        else:
+            local_history = get_watch_history()
         
         results["total_items"] = len(local_history)
         
@@ -320,8 +391,14 @@ def sync_history(services, progress=None, progress_start=50, progress_range=40,
                 f"Processing {len(local_history)} history items..."
             )
         
+        # Progress bar invariants; the dialog is only updated when the percentage changes
+        service_range = progress_range / len(services)
+        item_step = service_range / max(len(local_history), 1)
+        last_pct = None
+        
         # Process each service
         for i, service in enumerate(services):
+            service_base = progress_start + i * service_range
             service_result = {
                 "items_processed": 0,
                 "items_synced": 0,
@@ -334,14 +411,14 @@ def sync_history(services, progress=None, progress_start=50, progress_range=40,
                     try:
                         # Update progress
                         if progress:
-                            # Ensure local_history is not empty to avoid division by zero
-                            progress_denominator = len(local_history) if len(local_history) > 0 else 1
-                            progress_pct = progress_start + int((i + j/progress_denominator) * (progress_range/len(services)))
-                            progress.update(
-                                progress_pct,
-                                f"Syncing to {service.upper()}",
-                                f"Processing: {item.get('title', 'Unknown')} - Episode {item.get('episode', '?')}"
-                            )
+                            progress_pct = int(service_base + j * item_step)
+                            if progress_pct != last_pct:
+                                progress.update(
+                                    progress_pct,
+                                    f"Syncing to {service.upper()}",
+                                    f"Processing: {item.get('title', 'Unknown')} - Episode {item.get('episode', '?')}"
+                                )
+                                last_pct = progress_pct
                         
                         # Here you would implement the actual sync logic
                         # For now, we"ll just count the items
@@ -376,6 +453,81 @@ def sync_history(services, progress=None, progress_start=50, progress_range=40,
         results["errors"].append(error_msg)
         return results
 
+# Seconds without new watch events before a queued batch is synced
+SYNC_BATCH_DELAY = 5
+
+# Watch events (anime_id, episode, services) waiting for a batched history sync
+_sync_queue = queue.Queue()
+_sync_worker = None
+_sync_worker_lock = threading.Lock()
+
+def _queue_history_sync(anime_id, episode, services):
+    """Queue a watch event for syncing, starting the batch worker if it is not running.
+
+    Args:
+        anime_id (str): ID of the anime
+        episode (int): Episode number
+        services (list): Services to sync with
+    """
+    global _sync_worker
+    with _sync_worker_lock:
+        _sync_queue.put((anime_id, episode, tuple(services)))
+        if _sync_worker is None:
+            # Run on the SyncManager pool so sync_manager.cleanup() waits for the drain
+            _sync_worker = sync_manager.start_thread(target=_sync_queue_worker, name="HistorySyncQueue")
+
+def _sync_queue_worker():
+    """Drain the watch event queue in batches, exiting once it stays empty."""
+    global _sync_worker
+    batch = []
+    while True:
+        try:
+            batch.append(_sync_queue.get(timeout=SYNC_BATCH_DELAY))
+            continue
+        except queue.Empty:
+            pass
+        
+        if batch:
+            _flush_sync_batch(batch)
+            batch = []
+            continue
+        
+        with _sync_worker_lock:
+            if _sync_queue.empty():
+                _sync_worker = None
+                return
+
+def _flush_sync_batch(batch):
+    """Sync a batch of watch events once per anime and service set.
+
+    An anime with one distinct episode in the batch syncs just that episode;
+    one with several syncs all of its history rows so none are skipped.
+
+    Args:
+        batch (list): Queued (anime_id, episode, services) tuples
+    """
+    batch_episodes = {}
+    for anime_id, episode, services in batch:
+        batch_episodes.setdefault((anime_id, services), set()).add(episode)
+    
+    for (anime_id, services), episodes in batch_episodes.items():
+        # episode=None selects every history row for the anime
+        episode = next(iter(episodes)) if len(episodes) == 1 else None
+        try:
+            sync_results = sync_history(
+                services=list(services),
+                anime_id=anime_id,
+                episode=episode,
+                progress=None
+            )
+            
+            if "error" in sync_results:
+                log(f"Error syncing watch status: {sync_results.get('error')}", xbmc.LOGERROR)
+            else:
+                log(f"Successfully synced watch status for {anime_id} with {len(services)} services")
+        except Exception as e:
+            log(f"Error during watch status sync: {str(e)}", xbmc.LOGERROR)
+
 def update_watch_status(anime_id, episode, status="completed", progress=100, source="anilist", title="", image="", episode_count=0, sync_services=True):
     """
     Update watch status for an anime episode and sync with services
@@ -396,7 +548,6 @@ def update_watch_status(anime_id, episode, status="completed", progress=100, sou
     """
     try:
         # Record the watch in local history
-        from resources.lib.history import record_watch
         record_watch(
             anime_id=anime_id,
             title=title,
@@ -411,32 +562,19 @@ def update_watch_status(anime_id, episode, status="completed", progress=100, sou
         log(f"Updated watch status for {title} episode {episode}: {status} ({progress}%)")
         
         # Sync with external services if enabled
+        # Check the sync switches first so the common sync-off case reads only two settings
         if sync_services and ADDON.getSettingBool("sync_enabled") and ADDON.getSettingBool("sync_history"):
             services_to_sync_with = [] # Renamed to avoid conflict
-            if ADDON.getSettingBool("anilist_enabled") and source != "anilist":
+            if source != "anilist" and ADDON.getSettingBool("anilist_enabled"):
                 services_to_sync_with.append("anilist")
-            if ADDON.getSettingBool("mal_enabled") and source != "mal":
+            if source != "mal" and ADDON.getSettingBool("mal_enabled"):
                 services_to_sync_with.append("mal")
-            if ADDON.getSettingBool("trakt_enabled") and source != "trakt":
+            if source != "trakt" and ADDON.getSettingBool("trakt_enabled"):
                 services_to_sync_with.append("trakt")
             
             if services_to_sync_with:
-                log(f"Syncing watch status with services: {', '.join(services_to_sync_with)}")
-                try:
-                    # Sync the specific anime/episode that was just updated
-                    sync_results = sync_history(
-                        services=services_to_sync_with,
-                        anime_id=anime_id,
-                        episode=episode,
-                        progress=None
-                    )
-                    
-                    if "error" in sync_results:
-                        log(f"Error syncing watch status: {sync_results.get('error')}", xbmc.LOGERROR)
-                    else:
-                        log(f"Successfully synced watch status with {len(services_to_sync_with)} services")
-                except Exception as e:
-                    log(f"Error during watch status sync: {str(e)}", xbmc.LOGERROR)
+                log(f"Queueing watch status sync with services: {', '.join(services_to_sync_with)}")
+                _queue_history_sync(anime_id, episode, services_to_sync_with)
         
         return True
         
@@ -446,111 +584,149 @@ def update_watch_status(anime_id, episode, status="completed", progress=100, sou
 
 def log_sync_results(watchlist_results, history_results):
     """
-    Log the results of a sync operation
+    Log the results of a sync operation as a single log entry
     
     Args:
         watchlist_results (dict): Results from watchlist sync
         history_results (dict): Results from history sync
     """
     try:
-        # Log watchlist results
-        log("=" * 50)
-        log("SYNC RESULTS")
-        log("-" * 50)
+        # Collect every line first and log once, at the most severe level seen
+        out = ["=" * 50, "SYNC RESULTS", "-" * 50]
+        level = xbmc.LOGINFO
         
+        # Watchlist results
         if watchlist_results:
-            log(f"WATCHLIST SYNC: {watchlist_results.get('synced_items', 0)}/{watchlist_results.get('total_items', 0)} items synced")
+            out.append(f"WATCHLIST SYNC: {watchlist_results.get('synced_items', 0)}/{watchlist_results.get('total_items', 0)} items synced")
             for service, result in watchlist_results.get("service_results", {}).items():
-                log(f"  {service.upper()}: Processed {result.get('items_processed', 0)}, Added {result.get('items_added', 0)}, Removed {result.get('items_removed', 0)}")
+                out.append(f"  {service.upper()}: Processed {result.get('items_processed', 0)}, Added {result.get('items_added', 0)}, Removed {result.get('items_removed', 0)}")
                 if result.get("errors"):
-                    for err in result["errors"]:
-                        log(f"    ERROR: {err}", xbmc.LOGWARNING)
+                    level = max(level, xbmc.LOGWARNING)
+                    out.extend(f"    ERROR: {err}" for err in result["errors"])
             if watchlist_results.get("errors"):
-                for err in watchlist_results["errors"]:
-                    log(f"  OVERALL WATCHLIST ERROR: {err}", xbmc.LOGERROR)
+                level = xbmc.LOGERROR
+                out.extend(f"  OVERALL WATCHLIST ERROR: {err}" for err in watchlist_results["errors"])
         else:
-            log("WATCHLIST SYNC: No results or not performed.")
+            out.append("WATCHLIST SYNC: No results or not performed.")
 
-        log("-" * 50)
-        # Log history results
+        out.append("-" * 50)
+        # History results
         if history_results:
-            log(f"HISTORY SYNC: {history_results.get('synced_items', 0)}/{history_results.get('total_items', 0)} items synced")
+            out.append(f"HISTORY SYNC: {history_results.get('synced_items', 0)}/{history_results.get('total_items', 0)} items synced")
             for service, result in history_results.get("service_results", {}).items():
-                log(f"  {service.upper()}: Processed {result.get('items_processed', 0)}, Synced {result.get('items_synced', 0)}")
+                out.append(f"  {service.upper()}: Processed {result.get('items_processed', 0)}, Synced {result.get('items_synced', 0)}")
                 if result.get("errors"):
-                    for err in result["errors"]:
-                        log(f"    ERROR: {err}", xbmc.LOGWARNING)
+                    level = max(level, xbmc.LOGWARNING)
+                    out.extend(f"    ERROR: {err}" for err in result["errors"])
             if history_results.get("errors"):
-                for err in history_results["errors"]:
-                    log(f"  OVERALL HISTORY ERROR: {err}", xbmc.LOGERROR)
+                level = xbmc.LOGERROR
+                out.extend(f"  OVERALL HISTORY ERROR: {err}" for err in history_results["errors"])
         else:
-            log("HISTORY SYNC: No results or not performed.")
+            out.append("HISTORY SYNC: No results or not performed.")
             
-        log("=" * 50)
+        out.append("=" * 50)
+        log("\n".join(out), level)
 
     except Exception as e:
         log(f"Error logging sync results: {str(e)}", xbmc.LOGERROR)
 
 class SyncManager:
+    """Runs sync work on a small, reused pool of worker threads."""
+    MAX_WORKERS = 4
+
     def __init__(self):
-        self.threads = []
+        self._pool = None
+        self._futures = weakref.WeakSet()
+        self._lock = threading.Lock()
 
     def start_thread(self, target, name, *args, **kwargs):
-        thread = threading.Thread(target=target, name=name, args=args, kwargs=kwargs)
-        thread.start()
-        self.threads.append(thread)
+        """Submit target to the worker pool.
+
+        Args:
+            target (callable): Function to run.
+            name (str): Task name, used for logging.
+
+        Returns:
+            concurrent.futures.Future: Future for the submitted task.
+        """
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.MAX_WORKERS, thread_name_prefix="SyncMgr")
+            future = self._pool.submit(target, *args, **kwargs)
+            self._futures.add(future)
+        log(f"Started sync task {name}", xbmc.LOGDEBUG)
+        return future
 
     def cleanup(self):
-        for thread in self.threads:
-            thread.join()
-        self.threads.clear()
+        """Wait for all submitted tasks to finish and release the worker threads."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool:
+            pool.shutdown(wait=True)
 
 # Example usage of SyncManager
 sync_manager = SyncManager()
 
+# Epoch seconds of the last completed sync, parsed from the last_sync_time setting
+_last_sync_epoch = None
+
+def _parse_sync_time(last_sync_time_str):
+    """Convert the ISO last_sync_time setting to epoch seconds (None if unset or invalid)."""
+    if not last_sync_time_str:
+        return None
+    try:
+        return datetime.fromisoformat(last_sync_time_str).timestamp()
+    except ValueError:
+        return None
+
 def run_monitor():
     """Run the sync monitor in a separate thread."""
+    monitor = SettingsMonitor()
+
     def monitor_loop():
-        while not xbmc.abortRequested:
+        global _last_sync_epoch
+        settings = None
+        sync_interval_hours = 0
+        while not monitor.abortRequested():
             try:
-                if ADDON.getSettingBool("sync_enabled") and ADDON.getSettingBool("sync_on_idle"):
+                # Only re-read settings after Kodi reports a change
+                if monitor.settings_dirty:
+                    settings = _snapshot_settings()
+                    sync_interval_hours = ADDON.getSettingInt("sync_interval")
+                    _last_sync_epoch = _parse_sync_time(ADDON.getSetting("last_sync_time"))
+                    monitor.settings_dirty = False
+                
+                if settings["sync_enabled"] and settings["sync_on_idle"]:
                     # Check if Kodi is idle (this is a placeholder, actual idle detection is complex)
                     # For now, we just sync based on interval if sync_on_idle is true
                     # A more robust idle check would involve Kodi JSON-RPC calls or specific conditions
                     log("Idle sync check (currently interval based if enabled)")
                     # Perform sync based on interval
-                    sync_interval_hours = ADDON.getSettingInt("sync_interval")
-                    last_sync_time_str = ADDON.getSetting("last_sync_time")
-                    
-                    if last_sync_time_str:
-                        last_sync_time = datetime.fromisoformat(last_sync_time_str)
-                        if (datetime.now() - last_sync_time).total_seconds() > sync_interval_hours * 3600:
-                            log("Sync interval reached, starting sync...")
-                            sync_all() # No progress dialog for background sync
-                            ADDON.setSetting("last_sync_time", datetime.now().isoformat())
-                    else:
+                    if _last_sync_epoch is None:
                         # First time sync or setting cleared
                         log("No last sync time found, syncing now...")
-                        sync_all()
-                        ADDON.setSetting("last_sync_time", datetime.now().isoformat())
+                        should_sync = True
+                    else:
+                        should_sync = time.time() - _last_sync_epoch > sync_interval_hours * 3600
+                        if should_sync:
+                            log("Sync interval reached, starting sync...")
+                    
+                    if should_sync:
+                        sync_all() # No progress dialog for background sync
+                        _last_sync_epoch = time.time()
+                        ADDON.setSetting("last_sync_time", datetime.fromtimestamp(_last_sync_epoch).isoformat())
                 
                 # Sleep for a reasonable interval before checking again
                 # This interval should be configurable or a sensible default
                 # For now, let's use a fixed interval (e.g., 15 minutes)
                 monitor_interval_seconds = 15 * 60 
-                for _ in range(monitor_interval_seconds):
-                    if xbmc.abortRequested:
-                        break
-                    time.sleep(1)
+                if monitor.waitForAbort(monitor_interval_seconds):
+                    break
             except Exception as e:
                 log(f"Error in sync monitor loop: {str(e)}", xbmc.LOGERROR)
                 # Sleep for a bit longer on error to avoid rapid error loops
-                for _ in range(300): # 5 minutes
-                    if xbmc.abortRequested:
-                        break
-                    time.sleep(1)
-            if xbmc.abortRequested:
-                break
+                if monitor.waitForAbort(300): # 5 minutes
+                    break
         log("Sync monitor loop aborted.")
 
     if ADDON.getSettingBool("sync_enabled") and ADDON.getSettingBool("sync_on_idle"):
@@ -591,7 +767,7 @@ if __name__ == "__main__":
     
     sync_results = sync_all(progress_callback=test_progress_callback, cancel_flag=cancel_event)
     progress_dialog.close()
-    log(f"Sync results: {json.dumps(sync_results, indent=2)}")
+    log(f"Sync results: {json.dumps(sync_results, separators=(',', ':'))}")
 
     try:
         # ...existing code...
@@ -1,4 +1,126 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import wraps
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Cache lifetimes in seconds
+CACHE_TTL = {
+    'search_tv': 6 * 3600,       # 6 hours
+    'get_tv_details': 86400,     # 24 hours
+    'get_episodes': 3600         # 1 hour
+}
+
+# In-memory response cache shared by all TMDBAPI instances: key -> (expiry time, result)
+_CACHE = {}
+# Requests currently being fetched: key -> Future, so concurrent callers share one request
+_INFLIGHT = {}
+_CACHE_LOCK = threading.Lock()
+
+def ttl_cached(func):
+    """Memoize a TMDBAPI method for CACHE_TTL[method name] seconds, keyed on its arguments.
+
+    Concurrent cache misses for the same key wait on the first caller's request
+    instead of issuing their own.
+    """
+    ttl = CACHE_TTL[func.__name__]
+
+    @wraps(func)
+    def wrapper(self, *args):
+        key = (func.__name__, self.api_key) + args
+        now = time.time()
+        with _CACHE_LOCK:
+            entry = _CACHE.get(key)
+            if entry and entry[0] > now:
+                return entry[1]
+            future = _INFLIGHT.get(key)
+            owner = future is None
+            if owner:
+                future = _INFLIGHT[key] = Future()
+        if not owner:
+            return future.result()
+        try:
+            result = func(self, *args)
+        except Exception as e:
+            with _CACHE_LOCK:
+                del _INFLIGHT[key]
+            future.set_exception(e)
+            raise
+        with _CACHE_LOCK:
+            _CACHE[key] = (now + ttl, result)
+            del _INFLIGHT[key]
+        future.set_result(result)
+        return result
+    return wrapper
+
+# Pooled HTTP session shared by all TMDBAPI instances, created on first use
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+def get_session():
+    """Return the shared keep-alive session, retrying 429/5xx responses with backoff."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _SESSION = session
+        return _SESSION
+
+# Season episode lists are also kept on disk so they survive between plugin invocations
+EPISODE_CACHE_TTL = CACHE_TTL['get_episodes']
+# Show details are kept on disk for a week, then revalidated with their ETag
+DETAILS_CACHE_TTL = 7 * 86400
+
+def _cache_file(filename):
+    """Path of a file in the on-disk TMDB cache directory"""
+    import xbmcaddon
+    import xbmcvfs
+    cache_dir = os.path.join(xbmcvfs.translatePath(xbmcaddon.Addon().getAddonInfo('profile')), 'tmdb')
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, filename)
+
+def _episode_cache_file(tmdb_id, season_number):
+    """Path of the on-disk cache file for one season's episodes"""
+    return _cache_file(f'{tmdb_id}_s{season_number}.json')
+
+def _read_episode_cache(path):
+    """Return the cached episode list, or None if missing or older than EPISODE_CACHE_TTL"""
+    try:
+        if time.time() - os.path.getmtime(path) >= EPISODE_CACHE_TTL:
+            return None
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _read_details_cache(path):
+    """Return ({'etag', 'data'}, fresh) for a cached details file, or (None, False) if missing"""
+    try:
+        age = time.time() - os.path.getmtime(path)
+        with open(path, 'r') as f:
+            return json.load(f), age < DETAILS_CACHE_TTL
+    except (OSError, ValueError):
+        return None, False
+
+def _write_cache(path, payload):
+    """Atomically write a JSON payload to the on-disk cache"""
+    import xbmc
+    tmp_path = f'{path}.tmp'
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(payload, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        xbmc.log(f"TMDB cache write error: {e}", xbmc.LOGWARNING)
 
 class TMDBAPI:
     BASE_URL = 'https://api.themoviedb.org/3'
@@ -6,39 +128,88 @@ class TMDBAPI:
 
     def __init__(self, api_key):
         self.api_key = api_key
+        self.params = {'api_key': api_key}
+        self._session = None
 
+    @property
+    def session(self):
+        if self._session is None:
+            self._session = get_session()
+        return self._session
+
+    @ttl_cached
     def search_tv(self, query):
         """Search for TV shows by name (returns list of results)"""
         import xbmc
         url = f'{self.BASE_URL}/search/tv'
-        params = {'api_key': self.api_key, 'query': query}
-        resp = requests.get(url, params=params, timeout=10)
+        params = {**self.params, 'query': query}
+        resp = self.session.get(url, params=params, timeout=10)
         if resp.status_code != 200:
             xbmc.log(f"TMDB search_tv error: {resp.status_code} {resp.text}", xbmc.LOGERROR)
         resp.raise_for_status()
         return resp.json().get('results', [])
 
+    @ttl_cached
     def get_tv_details(self, tmdb_id):
         """Get TV show details by TMDB ID"""
         import xbmc
+        cache_file = _cache_file(f'tv_{tmdb_id}.json')
+        cached, fresh = _read_details_cache(cache_file)
+        if fresh:
+            return cached['data']
+        # Expired entries are revalidated, so an unchanged show costs a bodiless 304
+        headers = {'If-None-Match': cached['etag']} if cached and cached.get('etag') else None
         url = f'{self.BASE_URL}/tv/{tmdb_id}'
-        params = {'api_key': self.api_key}
-        resp = requests.get(url, params=params, timeout=10)
-        if resp.status_code != 200:
-            xbmc.log(f"TMDB get_tv_details error: {resp.status_code} {resp.text}", xbmc.LOGERROR)
-        resp.raise_for_status()
-        return resp.json()
+        try:
+            resp = self.session.get(url, params=self.params, headers=headers, timeout=10)
+            if resp.status_code == 304 and cached:
+                try:
+                    os.utime(cache_file)
+                except OSError:
+                    pass
+                return cached['data']
+            if resp.status_code != 200:
+                xbmc.log(f"TMDB get_tv_details error: {resp.status_code} {resp.text}", xbmc.LOGERROR)
+            resp.raise_for_status()
+            details = resp.json()
+        except requests.RequestException:
+            # Serve the expired copy through TMDB outages rather than losing the details
+            if cached:
+                return cached['data']
+            raise
+        _write_cache(cache_file, {'etag': resp.headers.get('ETag'), 'data': details})
+        return details
 
+    @ttl_cached
     def get_episodes(self, tmdb_id, season_number):
-        """Get all episodes for a given season"""
+        """Get all episodes for a given season, each with its full still URL in '_image_url'"""
         import xbmc
+        cache_file = _episode_cache_file(tmdb_id, season_number)
+        episodes = _read_episode_cache(cache_file)
+        if episodes is not None:
+            return episodes
         url = f'{self.BASE_URL}/tv/{tmdb_id}/season/{season_number}'
-        params = {'api_key': self.api_key}
-        resp = requests.get(url, params=params, timeout=10)
+        resp = self.session.get(url, params=self.params, timeout=10)
         if resp.status_code != 200:
             xbmc.log(f"TMDB get_episodes error: {resp.status_code} {resp.text}", xbmc.LOGERROR)
         resp.raise_for_status()
-        return resp.json().get('episodes', [])
+        episodes = resp.json().get('episodes', [])
+        for episode in episodes:
+            episode['_image_url'] = self.get_episode_image(episode.get('still_path'))
+        _write_cache(cache_file, episodes)
+        return episodes
+
+    def get_all_episodes(self, tmdb_id, season_numbers):
+        """Get the episodes of several seasons concurrently (returns {season_number: episodes})"""
+        season_numbers = list(season_numbers)
+        if not season_numbers:
+            return {}
+        episodes = {}
+        with ThreadPoolExecutor(max_workers=min(8, len(season_numbers))) as executor:
+            futures = {executor.submit(self.get_episodes, tmdb_id, season): season for season in season_numbers}
+            for future in as_completed(futures):
+                episodes[futures[future]] = future.result()
+        return episodes
 
     def get_episode_image(self, still_path):
         if still_path:
@@ -1,8 +1,44 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import xbmc
 import xbmcaddon
+import xbmcvfs
 from resources.lib.tmdb import TMDBAPI
 
 ADDON = xbmcaddon.Addon()
 
+# Title -> [tmdb_id, lookup time] map persisted between plugin invocations
+TMDB_ID_CACHE_TTL = 30 * 86400  # 30 days
+TMDB_ID_CACHE_FILE = os.path.join(xbmcvfs.translatePath(ADDON.getAddonInfo('profile')), 'tmdb_id_cache.json')
+_tmdb_id_cache = None
+_tmdb_id_cache_lock = threading.Lock()
+
+def _get_tmdb_id_cache():
+    """Load the persisted title -> TMDB ID map on first use"""
+    global _tmdb_id_cache
+    if _tmdb_id_cache is None:
+        try:
+            with open(TMDB_ID_CACHE_FILE, 'r') as f:
+                _tmdb_id_cache = json.load(f)
+        except (OSError, ValueError):
+            _tmdb_id_cache = {}
+    return _tmdb_id_cache
+
+def _save_tmdb_id_cache():
+    """Atomically write the title -> TMDB ID map to disk"""
+    tmp_path = f'{TMDB_ID_CACHE_FILE}.tmp'
+    try:
+        os.makedirs(os.path.dirname(TMDB_ID_CACHE_FILE), exist_ok=True)
+        with open(tmp_path, 'w') as f:
+            json.dump(_tmdb_id_cache, f, separators=(',', ':'))
+        os.replace(tmp_path, TMDB_ID_CACHE_FILE)
+    except OSError as e:
+        xbmc.log(f"TMDB ID cache write error: {e}", xbmc.LOGWARNING)
+
 def get_tmdb_api():
     if not ADDON.getSettingBool('tmdb_enabled'):
         return None
@@ -22,10 +58,67 @@ def test_tmdb_connection():
     except Exception as e:
         return False, f'TMDB authentication failed: {e}'
 
-def find_tmdb_id(anime_title):
-    tmdb = get_tmdb_api()
+def find_tmdb_id(anime_title, tmdb=None):
+    """
+    Find the TMDB ID for a title. Results (including misses) are remembered on
+    disk for TMDB_ID_CACHE_TTL. Pass tmdb to reuse an existing TMDBAPI instance.
+    """
+    tmdb = tmdb or get_tmdb_api()
     if not tmdb:
         return None
+    with _tmdb_id_cache_lock:
+        entry = _get_tmdb_id_cache().get(anime_title)
+    if entry and time.time() - entry[1] < TMDB_ID_CACHE_TTL:
+        return entry[0]
+    tmdb_id = _search_tmdb_id(tmdb, anime_title)
+    with _tmdb_id_cache_lock:
+        _get_tmdb_id_cache()[anime_title] = [tmdb_id, int(time.time())]
+        _save_tmdb_id_cache()
+    return tmdb_id
+
+def find_tmdb_ids_batch(titles, tmdb=None):
+    """
+    Resolve several titles to TMDB IDs at once, returning {title: tmdb_id}.
+    Cached titles are answered from the disk map, the rest are searched
+    concurrently over the shared session and the map is saved once.
+    """
+    tmdb = tmdb or get_tmdb_api()
+    if not tmdb:
+        return {}
+    now = time.time()
+    ids = {}
+    missing = []
+    with _tmdb_id_cache_lock:
+        cache = _get_tmdb_id_cache()
+        for title in set(titles):
+            entry = cache.get(title)
+            if entry and now - entry[1] < TMDB_ID_CACHE_TTL:
+                ids[title] = entry[0]
+            else:
+                missing.append(title)
+    if not missing:
+        return ids
+
+    def _search(title):
+        try:
+            return title, _search_tmdb_id(tmdb, title), True
+        except Exception as e:
+            xbmc.log(f"TMDB search failed for {title}: {e}", xbmc.LOGWARNING)
+            return title, None, False
+
+    with ThreadPoolExecutor(max_workers=min(8, len(missing))) as executor:
+        results = list(executor.map(_search, missing))
+    with _tmdb_id_cache_lock:
+        cache = _get_tmdb_id_cache()
+        for title, tmdb_id, ok in results:
+            ids[title] = tmdb_id
+            # Don't remember failed lookups, only genuine misses
+            if ok:
+                cache[title] = [tmdb_id, int(now)]
+        _save_tmdb_id_cache()
+    return ids
+
+def _search_tmdb_id(tmdb, anime_title):
     results = tmdb.search_tv(anime_title)
     if not results:
         return None
@@ -37,10 +130,17 @@ def find_tmdb_id(anime_title):
     return results[0]['id'] if results else None
 
 def get_tmdb_episodes(anime_title, season=1):
+    """
+    Get TMDB episodes for a single season, or for a list of seasons fetched
+    concurrently (returned as {season_number: episodes}).
+    """
+    multiple = isinstance(season, (list, tuple, set))
     tmdb = get_tmdb_api()
     if not tmdb:
-        return []
-    tmdb_id = find_tmdb_id(anime_title)
+        return {} if multiple else []
+    tmdb_id = find_tmdb_id(anime_title, tmdb)
     if not tmdb_id:
-        return []
+        return {} if multiple else []
+    if multiple:
+        return tmdb.get_all_episodes(tmdb_id, season)
     return tmdb.get_episodes(tmdb_id, season)
@@ -4,17 +4,24 @@ ui.py: Kodi UI navigation and directory listing for the AnimeDB Helper plugin.
 This module provides all user-facing directory and detail views, including anime lists, details, genres, watchlists, history,
 and search. It integrates with the API and player systems, and handles all Kodi plugin UI actions.
 """
+import atexit
 import os
+import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
 import xbmcplugin
 import xbmcgui
 import xbmc
 import xbmcaddon
 import xbmcvfs
-from urllib.parse import urlencode, parse_qs
+from urllib.parse import urlencode, parse_qs, quote_plus
 
-from resources.lib.api import AnimeDBAPI
-from resources.lib.fanart import fetch_art
+from resources.lib.api import AnimeDBAPI, cached
+from resources.lib.fanart import fetch_art, fetch_art_batch
 
 from resources.lib.history import get_watch_history, get_continue_watching
 
@@ -31,39 +38,102 @@ def list_last_watched(handle):
     anime_id = item['id']
     episode = item['episode']
     source = item.get('source', 'anilist')
-    # Fetch anime details
-    api = AnimeDBAPI()
-    details = api.anime_details(anime_id, source)
+    # Fetch anime details with the shared module-level client
+    details = API.anime_details(anime_id, source)
     if not details:
         xbmcgui.Dialog().notification("Last Watched", "Could not fetch anime details.", xbmcgui.NOTIFICATION_ERROR)
         xbmcplugin.endOfDirectory(handle)
         return
     # Compose label
     label = f"{details.get('title', '')} - Episode {episode}"
-    li = xbmcgui.ListItem(label)
+    li = xbmcgui.ListItem(label, offscreen=True)
     li.setInfo('video', {'title': details.get('title', ''), 'episode': episode})
     url = f"plugin://{ADDON_ID}/?action=play_item_route&id={anime_id}&source={source}&episode={episode}"
     xbmcplugin.addDirectoryItem(handle, url, li, isFolder=False)
     xbmcplugin.endOfDirectory(handle)
 
-from resources.lib.recommendations import get_recommendations, get_similar_anime
-from resources.lib.upcoming import get_upcoming, get_calendar
-from resources.lib.watchlist import get_local_watchlist, is_in_watchlist, toggle_watchlist
+from resources.lib.watchlist import get_local_watchlist, get_local_watchlist_set, is_in_watchlist, toggle_watchlist
 
 # Get addon instance
 ADDON = xbmcaddon.Addon()
 ADDON_ID = ADDON.getAddonInfo('id')
 ADDON_PATH = ADDON.getAddonInfo('path')
+MEDIA_DIR = os.path.join(ADDON_PATH, 'resources', 'media')
+FALLBACK_IMG = xbmcvfs.translatePath(f'special://home/addons/{ADDON_ID}/resources/media/studio_fallback.png')
+
+# Base of every plugin URL; append urlencode(params)
+_PLUGIN_BASE = f'plugin://{ADDON_ID}/?'
+
+# Per-item plugin URL templates for list_anime, filled with %-formatting (titles must be quote_plus'd)
+_URL_LIST_EPISODES = f'plugin://{ADDON_ID}/?action=list_episodes&id=%s&source=%s&title=%s'
+_URL_DETAILS = f'plugin://{ADDON_ID}/?action=details&id=%s&source=%s'
+_URL_PLAY = f'plugin://{ADDON_ID}/?action=play_item_route&id=%s&source=%s&episode=1'
+# Context-menu builtins built on the same templates
+_CMD_PLAY = f'RunPlugin({_URL_PLAY})'
+_CMD_TOGGLE_WATCHLIST = f'RunPlugin(plugin://{ADDON_ID}/?action=toggle_watchlist&id=%s&source=%s)'
+_CMD_SIMILAR = f'Container.Update(plugin://{ADDON_ID}/?action=similar&id=%s&source=%s&title=%s)'
+# Watchlist toggle labels; both states run the same toggle command
+_WATCHLIST_ADD_LABEL = 'Add to Watchlist'
+_WATCHLIST_REMOVE_LABEL = 'Remove from Watchlist'
+# Formats whose default click opens the episode list rather than the details view
+_EPISODE_LIST_FORMATS = frozenset(('TV', 'TV_SHORT', 'ONA', 'SPECIAL'))
+
+# Library status rows in the details dialog: (label, status)
+_STATUS_OPTIONS = (
+    ("  - Watching", 'CURRENT'),
+    ("  - Completed", 'COMPLETED'),
+    ("  - On Hold", 'PAUSED'),
+    ("  - Dropped", 'DROPPED'),
+    ("  - Plan to Watch", 'PLANNING'),
+)
 
 # Create API instance
 API = AnimeDBAPI()
 
+# Disk cache lifetimes (seconds) for directory listings, so Back/re-open skips the network
+TRENDING_CACHE_TTL = 300     # 5 minutes
+SEASONAL_CACHE_TTL = 3600    # 1 hour
+GENRES_CACHE_TTL = 3600      # 1 hour
+# Listings older than their TTL are still shown up to this age while being refreshed
+LISTING_STALE_TTL = 86400    # 24 hours
+
+# Anime seasons in calendar order
+_SEASONS = ('WINTER', 'SPRING', 'SUMMER', 'FALL')
+
+# Season for each month (index 1-12); December counts as next year's winter
+_SEASON_BY_MONTH = (None, 'WINTER', 'WINTER', 'SPRING', 'SPRING', 'SPRING', 'SUMMER',
+                    'SUMMER', 'SUMMER', 'FALL', 'FALL', 'FALL', 'WINTER')
+
+# Prefetches wait this long (seconds) before firing so rapid paging can cancel them
+PREFETCH_DELAY = 0.3
+# Home window property naming the latest scheduled prefetch, shared by all plugin invocations
+_PREFETCH_TOKEN_PROPERTY = 'AnimeDB.PrefetchToken'
+_pending_prefetch = None
+
+# Worker pool for the per-item TMDB/artwork lookups in list_anime
+_META_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix='ListMeta')
+atexit.register(_META_EXECUTOR.shutdown, wait=False)
+# Seconds list_anime waits for those lookups before rendering the rest with list artwork only
+META_TIMEOUT = 10
+
+# Words for _wrap_text
+_WORD_RE = re.compile(r'\S+')
+
 def add_directory_item(handle, label, params, icon_image=None, is_folder=True, fanart=None, description=None, context_menu=None):
     """
-    Helper function to add a directory item to the Kodi interface
+    Helper function to add a single directory item to the Kodi interface.
+    Menus with several rows should collect build_directory_item results and
+    add them with one xbmcplugin.addDirectoryItems call instead.
+    """
+    url, li, is_folder = build_directory_item(label, params, icon_image, is_folder, fanart, description, context_menu)
+    xbmcplugin.addDirectoryItem(handle, url, li, is_folder)
+    return li
+
+def build_directory_item(label, params, icon_image=None, is_folder=True, fanart=None, description=None, context_menu=None):
+    """
+    Build a directory item without adding it
     
     Args:
-        handle: Kodi plugin handle
         label: Item label
         params: Dictionary of URL parameters
         icon_image: Optional icon image filename (will be prefixed with addon path)
@@ -71,15 +141,18 @@ def add_directory_item(handle, label, params, icon_image=None, is_folder=True, f
         fanart: Optional fanart image path
         description: Optional description text
         context_menu: List of (label, action) tuples for context menu items
+    
+    Returns:
+        (url, list item, is_folder) tuple for xbmcplugin.addDirectoryItems
     """
     # Create list item
-    li = xbmcgui.ListItem(label)
+    li = xbmcgui.ListItem(label, offscreen=True)
     
     # Set icon and fanart
     if icon_image:
         # Check if it's a full path or just a filename
         if not icon_image.startswith(('http://', 'https://', 'special://', '/')):
-            icon_image = os.path.join(ADDON_PATH, 'resources', 'media', icon_image)
+            icon_image = f'{MEDIA_DIR}/{icon_image}'
         li.setArt({'icon': icon_image, 'thumb': icon_image})
     
     if fanart:
@@ -96,17 +169,114 @@ def add_directory_item(handle, label, params, icon_image=None, is_folder=True, f
         li.addContextMenuItems(context_menu)
     
     # Build URL
-    url = f'plugin://{ADDON_ID}/?{urlencode(params)}'
-    
-    # Add to directory
-    xbmcplugin.addDirectoryItem(
-        handle=handle,
-        url=url,
-        listitem=li,
-        isFolder=is_folder
-    )
+    url = _PLUGIN_BASE + urlencode(params)
     
-    return li
+    return url, li, is_folder
+
+def _resolve_meta(anime, tmdb_api, tmdb_id):
+    """
+    Network part of list_anime for a single item, run on the worker pool.
+    Returns (anime, tmdb_meta, art) where art is only fetched when TMDB has no match
+    and the list item lacks its own poster or banner.
+    """
+    tmdb_meta = None
+    if tmdb_api and tmdb_id:
+        try:
+            tmdb_meta = tmdb_api.get_tv_details(tmdb_id)
+        except Exception:
+            tmdb_meta = None
+    if tmdb_meta:
+        return anime, tmdb_meta, None
+    # The fetchers add nothing beyond poster/banner (clearlogo is always empty)
+    if anime.get('poster') and anime.get('banner'):
+        return anime, None, None
+    return anime, None, fetch_art(anime.get('id', ''), anime.get('source', 'anilist'))
+
+@lru_cache(maxsize=256)
+def _wrap_text(text, width=80):
+    """
+    Greedily wrap text into lines of at most width characters (longer words get
+    a line of their own). Returns a tuple; memoized since details are often reopened.
+    """
+    lines = []
+    line = ''
+    for word in _WORD_RE.findall(text):
+        if not line:
+            line = word
+        elif len(line) + 1 + len(word) > width:
+            lines.append(line)
+            line = word
+        else:
+            line = f'{line} {word}'
+    if line:
+        lines.append(line)
+    return tuple(lines)
+
+def _build_art(anime, tmdb_meta, image_base, fetched_art):
+    """
+    Build the final ListItem art dict for list_anime in one pass.
+    Uses TMDB images when there is a TMDB match, otherwise the list's own
+    poster/banner, then the fetched artwork, then FALLBACK_IMG.
+    """
+    if tmdb_meta:
+        poster_path = tmdb_meta.get('poster_path')
+        backdrop_path = tmdb_meta.get('backdrop_path')
+        poster = image_base + poster_path if poster_path else ''
+        backdrop = image_base + backdrop_path if backdrop_path else ''
+        return {
+            'poster': poster,
+            'fanart': backdrop,
+            'banner': backdrop,
+            'clearlogo': '',
+            'landscape': backdrop,
+            'thumb': poster
+        }
+    # AniList fallback
+    fetched_art = fetched_art or {}
+    poster = anime.get('poster') or fetched_art.get('poster') or FALLBACK_IMG
+    banner = anime.get('banner')
+    return {
+        'poster': poster,
+        'fanart': banner or fetched_art.get('fanart') or FALLBACK_IMG,
+        'banner': banner or fetched_art.get('banner') or FALLBACK_IMG,
+        'clearlogo': fetched_art.get('clearlogo') or FALLBACK_IMG,
+        'landscape': banner or fetched_art.get('landscape') or FALLBACK_IMG,
+        'thumb': poster
+    }
+
+def _cancel_prefetch():
+    """
+    Cancel any pending prefetch, including one scheduled by an earlier plugin
+    invocation, so a foreground listing fetch doesn't compete with it.
+    """
+    global _pending_prefetch
+    if _pending_prefetch:
+        _pending_prefetch.cancel()
+        _pending_prefetch = None
+    xbmcgui.Window(10000).clearProperty(_PREFETCH_TOKEN_PROPERTY)
+
+def _prefetch_listing(key, func, ttl):
+    """
+    Warm the listing cache for key on a background thread after PREFETCH_DELAY.
+    Dropped if another prefetch or listing supersedes it in the meantime.
+    """
+    global _pending_prefetch
+    _cancel_prefetch()
+    token = f'{key}@{time.time()}'
+    xbmcgui.Window(10000).setProperty(_PREFETCH_TOKEN_PROPERTY, token)
+
+    def _run():
+        if xbmcgui.Window(10000).getProperty(_PREFETCH_TOKEN_PROPERTY) != token:
+            return
+        try:
+            cached(key, func, ttl=ttl)
+        except Exception as e:
+            xbmc.log(f"Prefetch of {key} failed: {e}", xbmc.LOGWARNING)
+
+    # Not a daemon: the interpreter waits for the fetch after the directory is shown
+    _pending_prefetch = threading.Timer(PREFETCH_DELAY, _run)
+    _pending_prefetch.name = 'ListPrefetch'
+    _pending_prefetch.start()
 
 def list_anime(handle, anime_list, title=None):
     """
@@ -119,140 +289,96 @@ def list_anime(handle, anime_list, title=None):
     if title:
         xbmcplugin.setPluginCategory(handle, title)
     
-    from resources.lib.tmdb_bridge import get_tmdb_api, find_tmdb_id
-    for anime in anime_list:
+    # Without a TMDB key skip the TMDB modules and lookups entirely
+    tmdb_api = None
+    tmdb_ids = {}
+    if ADDON.getSettingBool('tmdb_enabled') and ADDON.getSetting('tmdb_api_key'):
+        from resources.lib.tmdb_bridge import get_tmdb_api, find_tmdb_ids_batch
+        tmdb_api = get_tmdb_api()
+        tmdb_ids = find_tmdb_ids_batch([anime.get('title', '') for anime in anime_list], tmdb_api)
+    # Display settings are constant for the whole page
+    show_plot = ADDON.getSettingBool('show_plot')
+    show_score = ADDON.getSettingBool('show_score')
+    image_base = tmdb_api.IMAGE_BASE if tmdb_api else ''
+    if tmdb_api:
+        # Fetch metadata/artwork for all items concurrently
+        futures = [
+            _META_EXECUTOR.submit(_resolve_meta, anime, tmdb_api, tmdb_ids.get(anime.get('title', '')))
+            for anime in anime_list
+        ]
+    else:
+        # Without TMDB only the artwork missing from the list is needed; fetch it in one batch
+        art_map = fetch_art_batch([
+            (anime.get('id', ''), anime.get('source', 'anilist'))
+            for anime in anime_list if not (anime.get('poster') and anime.get('banner'))
+        ])
+        futures = [None] * len(anime_list)
+    deadline = time.time() + META_TIMEOUT
+    # Read the watchlist once for the whole page
+    watchlist = get_local_watchlist_set()
+    items = []
+    # Build ListItems on this thread in list order as each lookup finishes,
+    # overlapping item construction with the lookups still in flight
+    for future, anime in zip(futures, anime_list):
+        if future is None:
+            tmdb_meta = None
+            fetched_art = art_map.get((str(anime.get('id', '')), anime.get('source', 'anilist')))
+        else:
+            try:
+                anime, tmdb_meta, fetched_art = future.result(timeout=max(0, deadline - time.time()))
+            except Exception:
+                tmdb_meta = fetched_art = None
         title = anime.get('title', '')
         anime_id = anime.get('id', '')
         source = anime.get('source', 'anilist')
 
-        # Try TMDB first
-        tmdb_api = get_tmdb_api()
-        tmdb_meta = None
-        if tmdb_api:
-            tmdb_id = find_tmdb_id(title)
-            if tmdb_id:
-                try:
-                    tmdb_meta = tmdb_api.get_tv_details(tmdb_id)
-                except Exception:
-                    tmdb_meta = None
-        # Compose artwork and info
-        art = {}
-        fallback_img = xbmcvfs.translatePath('special://home/addons/' + ADDON_ID + '/resources/media/studio_fallback.png')
-        if tmdb_meta:
-            art['poster'] = tmdb_meta.get('poster_path') and tmdb_api.IMAGE_BASE + tmdb_meta['poster_path'] or ''
-            art['fanart'] = tmdb_meta.get('backdrop_path') and tmdb_api.IMAGE_BASE + tmdb_meta['backdrop_path'] or ''
-            art['banner'] = tmdb_meta.get('backdrop_path') and tmdb_api.IMAGE_BASE + tmdb_meta['backdrop_path'] or ''
-            art['landscape'] = tmdb_meta.get('backdrop_path') and tmdb_api.IMAGE_BASE + tmdb_meta['backdrop_path'] or ''
-            art['clearlogo'] = ''
-        else:
-            # AniList fallback
-            art = fetch_art(anime_id, source)
-            if 'poster' in anime and anime['poster']:
-                art['poster'] = anime['poster']
-            if not art.get('poster'):
-                art['poster'] = fallback_img
-            if 'banner' in anime and anime['banner']:
-                art['fanart'] = anime['banner']
-                art['banner'] = anime['banner']
-                art['landscape'] = anime['banner']
-            if not art.get('fanart'):
-                art['fanart'] = fallback_img
-            if not art.get('banner'):
-                art['banner'] = fallback_img
-            if not art.get('landscape'):
-                art['landscape'] = fallback_img
-            if not art.get('clearlogo'):
-                art['clearlogo'] = fallback_img
         # Create list item
-        li = xbmcgui.ListItem(title)
-        # Set info
-        info = {'title': title, 'mediatype': 'tvshow'}
+        li = xbmcgui.ListItem(title, offscreen=True)
+        
+        # Use InfoTagVideo for video properties
+        info_tag = li.getVideoInfoTag()
+        info_tag.setTitle(title)
         # Plot/description
         if tmdb_meta and tmdb_meta.get('overview'):
-            info['plot'] = tmdb_meta['overview']
-        elif ADDON.getSettingBool('show_plot') and 'description' in anime:
-            info['plot'] = anime.get('description', '')
+            info_tag.setPlot(tmdb_meta['overview'])
+        elif show_plot and 'description' in anime:
+            info_tag.setPlot(anime.get('description', ''))
         # Score/rating
         if tmdb_meta and tmdb_meta.get('vote_average'):
-            info['rating'] = tmdb_meta['vote_average']
-        elif ADDON.getSettingBool('show_score') and 'score' in anime:
+            info_tag.setRating(tmdb_meta['vote_average'])
+        elif show_score and 'score' in anime:
             score = anime.get('score')
-            if score is not None:
-                info['rating'] = score / 10.0  # Convert to 0-10 scale
-            else:
-                info['rating'] = 0.0
+            info_tag.setRating(score / 10.0 if score is not None else 0.0)  # Convert to 0-10 scale
         
         # Add year if available
         if 'season_year' in anime:
-            info['year'] = anime.get('season_year', 0)
+            info_tag.setYear(anime.get('season_year', 0))
         
         # Add genres if available
         if 'genres' in anime:
-            info['genre'] = ', '.join(anime.get('genres', []))
-        
-        # Use InfoTagVideo for video properties
-        info_tag = li.getVideoInfoTag()
-        if 'title' in info:
-            info_tag.setTitle(info['title'])
-        if 'plot' in info:
-            info_tag.setPlot(info['plot'])
-        if 'rating' in info:
-            info_tag.setRating(info['rating'])
-        if 'year' in info:
-            info_tag.setYear(info['year'])
-        if 'genre' in info:
-            info_tag.setGenres(info['genre'].split(', ') if isinstance(info['genre'], str) else info['genre'])
-        # Add other properties as needed
+            info_tag.setGenres(anime.get('genres') or [])
         
         # Set artwork
-        li.setArt({
-            'poster': art.get('poster', ''),
-            'fanart': art.get('fanart', ''),
-            'banner': art.get('banner', ''),
-            'clearlogo': art.get('clearlogo', ''),
-            'landscape': art.get('landscape', ''),
-            'thumb': art.get('poster', '')
-        })
+        li.setArt(_build_art(anime, tmdb_meta, image_base, fetched_art))
         
         # Set default click: open episode list for TV/ONA/TV_SHORT/SPECIAL, open details for others
-        anime_format = anime.get('format', '').upper()
-        if anime_format in ['TV', 'TV_SHORT', 'ONA', 'SPECIAL']:
-            url = f"plugin://{ADDON_ID}/?action=list_episodes&id={anime_id}&source={source}&title={title}"
+        quoted_title = quote_plus(title)
+        episodes_url = _URL_LIST_EPISODES % (anime_id, source, quoted_title)
+        if anime.get('format', '').upper() in _EPISODE_LIST_FORMATS:
+            url = episodes_url
         else:
-            url = f"plugin://{ADDON_ID}/?action=details&id={anime_id}&source={source}"
+            url = _URL_DETAILS % (anime_id, source)
         
-        # Add context menu items
-        context_items = []
-        
-        # Add "Play" option to context menu that shows episode list
-        context_items.append((
-            'Play',
-            f"Container.Update(plugin://{ADDON_ID}/?action=list_episodes&id={anime_id}&source={source}&title={title})"
-        ))
-        
-        # Add direct play option (for non-TV shows)
-        context_items.append((
-            'Play Directly',
-            f"RunPlugin(plugin://{ADDON_ID}/?action=play_item_route&id={anime_id}&source={source}&episode=1)"
-        ))
-        
-        # Add "Toggle Watchlist" option
-        if is_in_watchlist(anime_id, source):
-            context_items.append((
-                'Remove from Watchlist',
-                f"RunPlugin(plugin://{ADDON_ID}/?action=toggle_watchlist&id={anime_id}&source={source})"
-            ))
-        else:
-            context_items.append((
-                'Add to Watchlist',
-                f"RunPlugin(plugin://{ADDON_ID}/?action=toggle_watchlist&id={anime_id}&source={source})"
-            ))
-        
-        # Add "Similar Anime" option
-        context_items.append((
-            'Similar Anime',
-            f"Container.Update(plugin://{ADDON_ID}/?action=similar&id={anime_id}&source={source}&title={title})"
-        ))
+        # Add context menu items: Play (episode list), Play Directly (non-TV), watchlist toggle, Similar Anime
+        context_items = [
+            ('Play', f"Container.Update({episodes_url})"),
+            ('Play Directly', _CMD_PLAY % (anime_id, source)),
+            (
+                _WATCHLIST_REMOVE_LABEL if (str(anime_id), source) in watchlist else _WATCHLIST_ADD_LABEL,
+                _CMD_TOGGLE_WATCHLIST % (anime_id, source)
+            ),
+            ('Similar Anime', _CMD_SIMILAR % (anime_id, source, quoted_title))
+        ]
         
         # Set context menu
         li.addContextMenuItems(context_items)
@@ -263,8 +389,10 @@ def list_anime(handle, anime_list, title=None):
         if 'score' in anime:
             li.setProperty("AnimeDB.Rating", str(anime.get('score', 0)))
         
-        # Add to directory
-        xbmcplugin.addDirectoryItem(handle, url, li, False)
+        items.append((url, li, False))
+    
+    # Hand the whole page to Kodi in one call; callers may still add items after it
+    xbmcplugin.addDirectoryItems(handle, items, len(items))
     
     # Add sort methods
     xbmcplugin.addSortMethod(handle, xbmcplugin.SORT_METHOD_LABEL)
@@ -273,23 +401,29 @@ def list_anime(handle, anime_list, title=None):
     
 
 # --- PLACEHOLDER UI FUNCTIONS FOR NAVIGATION ---
+# Main menu entries: (label, params, icon)
+_HOME_ITEMS = (
+    ('Continue Watching', {'action': 'continue_watching'}, 'continue.png'),
+    ('My Library', {'action': 'library'}, 'library.png'),
+    ('Watchlist', {'action': 'watchlist'}, 'watchlist.png'),
+    ('Trending Now', {'action': 'trending'}, 'trending.png'),
+    ('Current Season', {'action': 'seasonal'}, 'seasonal.png'),
+    ('Search', {'action': 'search_menu'}, 'search.png'),
+    ('History', {'action': 'history'}, 'history.png'),
+    ('Upcoming', {'action': 'upcoming'}, 'upcoming.png'),
+    ('Calendar', {'action': 'calendar'}, 'calendar.png'),
+    ('Genres', {'action': 'genres'}, 'genres.png'),
+    ('Settings', {'action': 'settings'}, 'settings.png'),
+)
+
 def home(handle):
     """Show the main menu with all available sections"""
     # Set content type
     xbmcplugin.setContent(handle, 'files')
     
     # Add menu items
-    add_directory_item(handle, 'Continue Watching', {'action': 'continue_watching'}, 'continue.png')
-    add_directory_item(handle, 'My Library', {'action': 'library'}, 'library.png')
-    add_directory_item(handle, 'Watchlist', {'action': 'watchlist'}, 'watchlist.png')
-    add_directory_item(handle, 'Trending Now', {'action': 'trending'}, 'trending.png')
-    add_directory_item(handle, 'Current Season', {'action': 'seasonal'}, 'seasonal.png')
-    add_directory_item(handle, 'Search', {'action': 'search_menu'}, 'search.png')
-    add_directory_item(handle, 'History', {'action': 'history'}, 'history.png')
-    add_directory_item(handle, 'Upcoming', {'action': 'upcoming'}, 'upcoming.png')
-    add_directory_item(handle, 'Calendar', {'action': 'calendar'}, 'calendar.png')
-    add_directory_item(handle, 'Genres', {'action': 'genres'}, 'genres.png')
-    add_directory_item(handle, 'Settings', {'action': 'settings'}, 'settings.png')
+    items = [build_directory_item(label, params, icon) for label, params, icon in _HOME_ITEMS]
+    xbmcplugin.addDirectoryItems(handle, items, len(items))
     
     # Set view mode
     set_view_mode('list')
@@ -307,8 +441,17 @@ def list_trending(handle, page=1, source=None):
     if source is None:
         source = ADDON.getSetting('default_source') or 'anilist'
     
+    # The user moved on; don't let an older prefetch compete with this fetch
+    _cancel_prefetch()
+    
     # Get trending anime
-    anime_list = API.get_trending_anime(page=page, per_page=int(ADDON.getSetting('items_per_page') or 20), source=source)
+    per_page = int(ADDON.getSetting('items_per_page') or 20)
+    anime_list = cached(
+        f'trending_{source}_{page}_{per_page}',
+        lambda: API.get_trending_anime(page=page, per_page=per_page, source=source),
+        ttl=LISTING_STALE_TTL,
+        stale_after=TRENDING_CACHE_TTL
+    )
     
     if not anime_list and page == 1:
         xbmcgui.Dialog().notification('No Results', 'No trending anime found', xbmcgui.NOTIFICATION_WARNING)
@@ -319,7 +462,7 @@ def list_trending(handle, page=1, source=None):
     list_anime(handle, anime_list, f'Trending on {source.upper()}')
     
     # Add pagination if needed
-    if len(anime_list) >= int(ADDON.getSetting('items_per_page') or 20):
+    if len(anime_list) >= per_page:
         next_page = page + 1
         add_directory_item(
             handle,
@@ -333,6 +476,14 @@ def list_trending(handle, page=1, source=None):
     add_source_selector(handle, 'trending', page, source)
     
     xbmcplugin.endOfDirectory(handle)
+    
+    # Fetch the next page while the user browses this one
+    if len(anime_list) >= per_page:
+        _prefetch_listing(
+            f'trending_{source}_{next_page}_{per_page}',
+            lambda: API.get_trending_anime(page=next_page, per_page=per_page, source=source),
+            TRENDING_CACHE_TTL
+        )
 
 def list_seasonal(handle, year=None, season=None, page=1, source=None):
     """
@@ -348,13 +499,22 @@ def list_seasonal(handle, year=None, season=None, page=1, source=None):
     if source is None:
         source = ADDON.getSetting('default_source') or 'anilist'
     
+    # The user moved on; don't let an older prefetch compete with this fetch
+    _cancel_prefetch()
+    
     # Get seasonal anime
-    anime_list = API.get_seasonal_anime(
-        year=year,
-        season=season,
-        page=page,
-        per_page=int(ADDON.getSetting('items_per_page') or 20),
-        source=source
+    per_page = int(ADDON.getSetting('items_per_page') or 20)
+    anime_list = cached(
+        f'seasonal_{source}_{year}_{season}_{page}_{per_page}',
+        lambda: API.get_seasonal_anime(
+            year=year,
+            season=season,
+            page=page,
+            per_page=per_page,
+            source=source
+        ),
+        ttl=LISTING_STALE_TTL,
+        stale_after=SEASONAL_CACHE_TTL
     )
     
     if not anime_list and page == 1:
@@ -367,31 +527,19 @@ def list_seasonal(handle, year=None, season=None, page=1, source=None):
         season_title = f'{season.capitalize()} {year}'
     else:
         # Auto-detect current season if not specified
-        import datetime
-        now = datetime.datetime.now()
+        now = datetime.now()
         month = now.month
-        year = now.year
-        
-        if month in [12, 1, 2]:
-            season = 'WINTER'
-        elif month in [3, 4, 5]:
-            season = 'SPRING'
-        elif month in [6, 7, 8]:
-            season = 'SUMMER'
-        else:
-            season = 'FALL'
-        
+        season = _SEASON_BY_MONTH[month]
         # Adjust year for winter season
-        if month == 12:
-            year += 1
-            
+        year = now.year + 1 if month == 12 else now.year
+        
         season_title = f'{season.capitalize()} {year}'
     
     # Add items to directory
     list_anime(handle, anime_list, f'{season_title} Anime on {source.upper()}')
     
     # Add pagination if needed
-    if len(anime_list) >= int(ADDON.getSetting('items_per_page') or 20):
+    if len(anime_list) >= per_page:
         next_page = page + 1
         add_directory_item(
             handle,
@@ -408,51 +556,66 @@ def list_seasonal(handle, year=None, season=None, page=1, source=None):
     add_source_selector(handle, 'seasonal', page, source, {'year': year, 'season': season})
     
     xbmcplugin.endOfDirectory(handle)
+    
+    # Fetch the next page while the user browses this one
+    if len(anime_list) >= per_page:
+        _prefetch_listing(
+            f'seasonal_{source}_{year}_{season}_{next_page}_{per_page}',
+            lambda: API.get_seasonal_anime(
+                year=year,
+                season=season,
+                page=next_page,
+                per_page=per_page,
+                source=source
+            ),
+            SEASONAL_CACHE_TTL
+        )
 
 def add_season_selector(handle, current_year, current_season, source):
     """Add season navigation to the directory"""
-    import datetime
-    now = datetime.datetime.now()
+    this_year = datetime.now().year
+    current_season = current_season.upper()
+    items = []
     
     # Add previous/next season navigation
-    seasons = ['WINTER', 'SPRING', 'SUMMER', 'FALL']
-    current_season_idx = seasons.index(current_season.upper()) if current_season.upper() in seasons else 0
+    seasons = _SEASONS
+    current_season_idx = seasons.index(current_season) if current_season in seasons else 0
     
     # Previous season
     prev_season_idx = (current_season_idx - 1) % 4
     prev_season_year = current_year - 1 if current_season_idx == 0 and prev_season_idx == 3 else current_year
-    add_directory_item(
-        handle,
+    items.append(build_directory_item(
         f'← {seasons[prev_season_idx].capitalize()} {prev_season_year}',
         {'action': 'seasonal', 'year': prev_season_year, 'season': seasons[prev_season_idx], 'source': source},
         'previous.png',
         is_folder=True
-    )
+    ))
     
     # Next season
     next_season_idx = (current_season_idx + 1) % 4
     next_season_year = current_year + 1 if current_season_idx == 3 and next_season_idx == 0 else current_year
-    add_directory_item(
-        handle,
+    items.append(build_directory_item(
         f'{seasons[next_season_idx].capitalize()} {next_season_year} →',
         {'action': 'seasonal', 'year': next_season_year, 'season': seasons[next_season_idx], 'source': source},
         'next.png',
         is_folder=True
-    )
+    ))
     
     # Add year selector
-    for year in range(now.year, now.year - 5, -1):
-        for season in seasons:
-            if year == current_year and season == current_season.upper():
-                continue
-                
-            add_directory_item(
-                handle,
-                f'{season.capitalize()} {year}',
-                {'action': 'seasonal', 'year': year, 'season': season, 'source': source},
-                'calendar.png',
-                is_folder=True
-            )
+    other_seasons = [
+        (year, season)
+        for year in range(this_year, this_year - 5, -1)
+        for season in seasons
+        if not (year == current_year and season == current_season)
+    ]
+    for year, season in other_seasons:
+        items.append(build_directory_item(
+            f'{season.capitalize()} {year}',
+            {'action': 'seasonal', 'year': year, 'season': season, 'source': source},
+            'calendar.png',
+            is_folder=True
+        ))
+    xbmcplugin.addDirectoryItems(handle, items, len(items))
 
 def add_source_selector(handle, action, page, current_source, extra_params=None):
     """Add source selector to the directory"""
@@ -465,18 +628,19 @@ def add_source_selector(handle, action, page, current_source, extra_params=None)
         ('Trakt', 'trakt')
     ]
     
+    items = []
     for name, source in sources:
         if source == current_source:
             continue
             
         params = {'action': action, 'page': page, 'source': source, **extra_params}
-        add_directory_item(
-            handle,
+        items.append(build_directory_item(
             f'Switch to {name}',
             params,
             f'source_{source}.png',
             is_folder=True
-        )
+        ))
+    xbmcplugin.addDirectoryItems(handle, items, len(items))
 
 
 def list_watchlist(handle):
@@ -486,23 +650,38 @@ def list_watchlist(handle):
 
 def show_settings_menu(handle):
     # Display settings menu for player configurations
-    player_name = ADDON.getSetting('player_name')
-    plugin_id = ADDON.getSetting('plugin_id')
-    command = ADDON.getSetting('command')
-    is_resolvable = ADDON.getSetting('is_resolvable')
+    values = {
+        'player_name': ADDON.getSetting('player_name'),
+        'plugin_id': ADDON.getSetting('plugin_id'),
+        'command': ADDON.getSetting('command'),
+        'is_resolvable': ADDON.getSetting('is_resolvable').lower() == 'true'
+    }
+    fields = [('player_name', 'Player Name'), ('plugin_id', 'Plugin ID'), ('command', 'Command')]
 
-    # Create dialog for user input
+    # Single form: all fields are shown at once and only the picked ones are edited
     dialog = xbmcgui.Dialog()
-    new_name = dialog.input('Enter Player Name', defaultt=player_name)
-    new_plugin_id = dialog.input('Enter Plugin ID', defaultt=plugin_id)
-    new_command = dialog.input('Enter Command', defaultt=command)
-    new_is_resolvable = dialog.yesno('Is Resolvable?', yeslabel='Yes', nolabel='No', defaultt=is_resolvable.lower() == 'true')
+    selected = 0
+    while True:
+        options = ['Save'] + [f'{label}: {values[key]}' for key, label in fields]
+        options.append(f"Is Resolvable: {'Yes' if values['is_resolvable'] else 'No'}")
+        choice = dialog.select('Player Settings', options, preselect=selected)
+        if choice == -1:  # User cancelled
+            xbmcplugin.endOfDirectory(handle)
+            return
+        elif choice == 0:  # Save
+            break
+        elif choice <= len(fields):
+            key, label = fields[choice - 1]
+            values[key] = dialog.input(f'Enter {label}', defaultt=values[key])
+        else:
+            values['is_resolvable'] = not values['is_resolvable']
+        selected = choice
 
     # Save new settings
-    ADDON.setSetting('player_name', new_name)
-    ADDON.setSetting('plugin_id', new_plugin_id)
-    ADDON.setSetting('command', new_command)
-    ADDON.setSetting('is_resolvable', 'true' if new_is_resolvable else 'false')
+    ADDON.setSetting('player_name', values['player_name'])
+    ADDON.setSetting('plugin_id', values['plugin_id'])
+    ADDON.setSetting('command', values['command'])
+    ADDON.setSetting('is_resolvable', 'true' if values['is_resolvable'] else 'false')
     xbmcgui.Dialog().notification('Settings', 'Player settings updated successfully.', xbmcgui.NOTIFICATION_INFO)
     xbmcplugin.setPluginCategory(handle, 'Continue Watching')
     xbmcplugin.endOfDirectory(handle)
@@ -516,7 +695,7 @@ def list_genres(handle):
         xbmcplugin.setContent(handle, 'genres')
         
         api = AnimeDBAPI()
-        genres = api.get_genres()
+        genres = cached('genre_list', api.get_genres, ttl=LISTING_STALE_TTL, stale_after=GENRES_CACHE_TTL)
         
         if not genres:
             xbmcgui.Dialog().notification("No Genres", "No genres found", xbmcgui.NOTIFICATION_INFO)
@@ -526,6 +705,7 @@ def list_genres(handle):
         # Sort genres by name
         genres = sorted(genres, key=lambda x: x['name'].lower())
         
+        items = []
         for genre in genres:
             name = genre['name']
             count = genre.get('count', 0)
@@ -533,7 +713,7 @@ def list_genres(handle):
             if count:
                 label += f" ({count})"
                 
-            li = xbmcgui.ListItem(label)
+            li = xbmcgui.ListItem(label, offscreen=True)
             
             # Set art
             li.setArt({
@@ -549,17 +729,12 @@ def list_genres(handle):
             li.setInfo('video', info)
             
             # Create URL
-            url = f'sys.argv[0]?action=list_genre&genre={name}'
+            url = _PLUGIN_BASE + urlencode({'action': 'list_genre', 'genre': name})
             
-            # Add to directory
-            xbmcplugin.addDirectoryItem(
-                handle=handle,
-                url=url,
-                listitem=li,
-                isFolder=True
-            )
+            items.append((url, li, True))
             
-        # Add sort method and end directory
+        # Add all items in one call, then sort method and end directory
+        xbmcplugin.addDirectoryItems(handle, items, len(items))
         xbmcplugin.addSortMethod(handle, xbmcplugin.SORT_METHOD_LABEL)
         xbmcplugin.endOfDirectory(handle)
         
@@ -579,7 +754,6 @@ def list_history(handle):
     list_anime(handle, anime_list, title='History')
 
 def list_continue_watching(handle):
-    from resources.lib.history import get_continue_watching
     anime_list = get_continue_watching()
     if not anime_list:
         xbmcgui.Dialog().notification("AnimeDB", "No continue watching items found", xbmcgui.NOTIFICATION_INFO)
@@ -603,8 +777,6 @@ def list_calendar(handle):
     Show a weekly calendar of anime episodes
     """
     try:
-        from datetime import datetime, timedelta
-        
         # Get today's date
         today = datetime.now()
         
@@ -616,13 +788,14 @@ def list_calendar(handle):
         xbmcplugin.setContent(handle, 'tvshows')
         
         # Add directory items for each day
+        items = []
         for date_str in dates:
             date_obj = datetime.strptime(date_str, '%Y-%m-%d')
             day_name = date_obj.strftime('%A')
             date_display = date_obj.strftime('%b %d, %Y')
             
             # Create a list item for the day
-            li = xbmcgui.ListItem(f"{day_name}, {date_display}")
+            li = xbmcgui.ListItem(f"{day_name}, {date_display}", offscreen=True)
             
             # Set art and info
             li.setArt({
@@ -631,17 +804,12 @@ def list_calendar(handle):
             })
             
             # Create URL for the date
-            url = f'sys.argv[0]?action=calendar_date&date={date_str}'
+            url = _PLUGIN_BASE + urlencode({'action': 'calendar_date', 'date': date_str})
             
-            # Add to directory
-            xbmcplugin.addDirectoryItem(
-                handle=handle,
-                url=url,
-                listitem=li,
-                isFolder=True
-            )
+            items.append((url, li, True))
         
-        # Add sort method and end directory
+        # Add all items in one call, then sort method and end directory
+        xbmcplugin.addDirectoryItems(handle, items, len(items))
         xbmcplugin.addSortMethod(handle, xbmcplugin.SORT_METHOD_TITLE)
         xbmcplugin.endOfDirectory(handle)
         
@@ -670,10 +838,11 @@ def list_calendar_date(handle, date):
         xbmcplugin.setContent(handle, 'episodes')
         
         # Add each episode to the list
+        items = []
         for episode in episodes:
             # Create list item
             title = f"{episode.get('show_title', 'Unknown')} - Episode {episode.get('episode', '?')}"
-            li = xbmcgui.ListItem(title)
+            li = xbmcgui.ListItem(title, offscreen=True)
             
             # Set art
             art = {
@@ -694,17 +863,12 @@ def list_calendar_date(handle, date):
             li.setInfo('video', info)
             
             # Create URL (this would be updated to play the actual episode)
-            url = f'sys.argv[0]?action=play&anime_id={episode.get("anime_id")}&episode={episode.get("episode")}'
+            url = _PLUGIN_BASE + urlencode({'action': 'play', 'anime_id': episode.get('anime_id'), 'episode': episode.get('episode')})
             
-            # Add to directory
-            xbmcplugin.addDirectoryItem(
-                handle=handle,
-                url=url,
-                listitem=li,
-                isFolder=False
-            )
+            items.append((url, li, False))
         
-        # Add sort method and end directory
+        # Add all items in one call, then sort method and end directory
+        xbmcplugin.addDirectoryItems(handle, items, len(items))
         xbmcplugin.addSortMethod(handle, xbmcplugin.SORT_METHOD_TITLE)
         xbmcplugin.endOfDirectory(handle)
         
@@ -839,10 +1003,11 @@ def search(handle, query=None, media_type=None, status=None, year=None, genre=No
         xbmcplugin.setContent(handle, 'tvshows')
         
         # Add results to directory
+        items = []
         for anime in results:
             # Create list item
             title = anime.get('title', 'Unknown')
-            li = xbmcgui.ListItem(title)
+            li = xbmcgui.ListItem(title, offscreen=True)
             
             # Set art
             art = {
@@ -869,39 +1034,24 @@ def search(handle, query=None, media_type=None, status=None, year=None, genre=No
             li.setProperty('IsPlayable', 'false')
             
             # Create URL for the anime
-            url = f'sys.argv[0]?action=anime_details&anime_id={anime.get("id")}&source=anilist'
+            url = _PLUGIN_BASE + urlencode({'action': 'anime_details', 'anime_id': anime.get('id'), 'source': 'anilist'})
             
-            # Add to directory
-            xbmcplugin.addDirectoryItem(
-                handle=handle,
-                url=url,
-                listitem=li,
-                isFolder=True
-            )
+            items.append((url, li, True))
         
         # Add pagination if needed
         if len(results) >= 20:  # Default page size
             next_page = page + 1
-            li = xbmcgui.ListItem('Next Page >>')
-            url = f'sys.argv[0]?action=search&query={query}'
-            if media_type:
-                url += f'&media_type={media_type}'
-            if status:
-                url += f'&status={status}'
-            if year:
-                url += f'&year={year}'
-            if genre:
-                url += f'&genre={genre}'
-            url += f'&page={next_page}'
+            li = xbmcgui.ListItem('Next Page >>', offscreen=True)
+            params = {
+                'action': 'search', 'query': query, 'media_type': media_type,
+                'status': status, 'year': year, 'genre': genre, 'page': next_page
+            }
+            url = _PLUGIN_BASE + urlencode({k: v for k, v in params.items() if v})
             
-            xbmcplugin.addDirectoryItem(
-                handle=handle,
-                url=url,
-                listitem=li,
-                isFolder=True
-            )
+            items.append((url, li, True))
         
-        # Add sort method and end directory
+        # Add all items in one call, then sort method and end directory
+        xbmcplugin.addDirectoryItems(handle, items, len(items))
         xbmcplugin.addSortMethod(handle, xbmcplugin.SORT_METHOD_TITLE)
         xbmcplugin.addSortMethod(handle, xbmcplugin.SORT_METHOD_VIDEO_YEAR)
         xbmcplugin.addSortMethod(handle, xbmcplugin.SORT_METHOD_VIDEO_RATING)
@@ -946,85 +1096,95 @@ def show_anime_details(anime_id, source='anilist', title=None):
     if tmdb_meta and tmdb_meta.get('name'):
         show_title = tmdb_meta['name']
     
-    # Create dialog items
+    def view_episodes():
+        url = _PLUGIN_BASE + urlencode({'action': 'list_episodes', 'id': anime_id, 'source': source, 'title': show_title})
+        xbmc.executebuiltin(f"Container.Update({url})")
+
+    def play():
+        xbmc.executebuiltin(_CMD_PLAY % (anime_id, source))
+
+    def add_to_library():
+        LIBRARY.add_to_library(anime_id, source, status="PLANNING")
+        xbmcgui.Dialog().notification("Added to Library", f"{show_title} has been added to your library", xbmcgui.NOTIFICATION_INFO)
+        xbmc.executebuiltin('Container.Refresh')
+
+    def remove_from_library():
+        if xbmcgui.Dialog().yesno("Confirm Removal", f"Remove {show_title} from your library?"):
+            LIBRARY.remove_from_library(anime_id, source)
+            xbmcgui.Dialog().notification("Removed from Library", f"{show_title} has been removed from your library", xbmcgui.NOTIFICATION_INFO)
+            xbmc.executebuiltin('Container.Refresh')
+
+    def change_status(new_status):
+        LIBRARY.add_to_library(anime_id, source, status=new_status)
+        xbmcgui.Dialog().notification("Status Updated", f"Status changed to {new_status.replace('_', ' ').title()}", xbmcgui.NOTIFICATION_INFO)
+        xbmc.executebuiltin('Container.Refresh')
+
+    def toggle():
+        toggle_watchlist(anime_id, source)
+        xbmc.executebuiltin('Container.Refresh')
+
+    # Create dialog items, with the action for each row at the same index (None for info rows)
     dialog_items = []
+    actions = []
     
     # Main actions
-    if details.get('format') in ['TV', 'TV_SHORT', 'ONA', 'SPECIAL']:
+    if details.get('format') in _EPISODE_LIST_FORMATS:
         dialog_items.append("View Episodes")
+        actions.append(view_episodes)
     else:
         dialog_items.append("Play")
+        actions.append(play)
     
     # Library actions
     if in_library:
         dialog_items.append("Remove from Library")
+        actions.append(remove_from_library)
         
         # Add status options
         current_status = in_library.get('status', '').upper()
-        status_options = [
-            ("Watching", 'CURRENT'),
-            ("Completed", 'COMPLETED'),
-            ("On Hold", 'PAUSED'),
-            ("Dropped", 'DROPPED'),
-            ("Plan to Watch", 'PLANNING')
-        ]
-        
         dialog_items.append(f"Status: {current_status}")
-        for status_name, status_value in status_options:
+        actions.append(None)
+        for status_label, status_value in _STATUS_OPTIONS:
             if status_value != current_status:
-                dialog_items.append(f"  - {status_name}")
+                dialog_items.append(status_label)
+                actions.append(lambda status_value=status_value: change_status(status_value))
     else:
         dialog_items.append("Add to Library")
+        actions.append(add_to_library)
     
     # Add to watchlist
-    if is_in_watchlist(anime_id, source):
-        dialog_items.append("Remove from Watchlist")
-    else:
-        dialog_items.append("Add to Watchlist")
+    dialog_items.append(_WATCHLIST_REMOVE_LABEL if is_in_watchlist(anime_id, source) else _WATCHLIST_ADD_LABEL)
+    actions.append(toggle)
     
     # Add metadata section
     dialog_items.append("\n[COLOR=FF00FF00]Details:[/COLOR]")
     
-    # Title
-    if details.get('original_title') and details['original_title'] != show_title:
-        dialog_items.append(f"Original Title: {details['original_title']}")
-    
-    # Format and status
+    # Title, format, status, airing dates, score, genres and studios; rows without a value are skipped
+    original_title = details.get('original_title')
     format_text = details.get('format', 'N/A')
     if details.get('episodes'):
         format_text += f" ({details['episodes']} episodes)"
-    dialog_items.append(f"Format: {format_text}")
-    
-    # Status
-    if details.get('status'):
-        dialog_items.append(f"Status: {details['status']}")
-    
-    # Airing dates
-    if details.get('start_date'):
-        airing_text = f"Aired: {details['start_date']}"
-        if details.get('end_date'):
-            airing_text += f" to {details['end_date']}"
-        dialog_items.append(airing_text)
-    
-    # Score
-    if details.get('score'):
-        dialog_items.append(f"Score: {details['score']}/100")
-    
-    # Genres
-    if details.get('genres'):
-        dialog_items.append(f"Genres: {', '.join(details['genres'])}")
-    
-    # Studios
-    if details.get('studios'):
-        dialog_items.append(f"Studios: {', '.join(details['studios'])}")
+    airing_text = details.get('start_date')
+    if airing_text and details.get('end_date'):
+        airing_text += f" to {details['end_date']}"
+    genres = details.get('genres')
+    studios = details.get('studios')
+    rows = (
+        ("Original Title: %s", original_title if original_title != show_title else None),
+        ("Format: %s", format_text),
+        ("Status: %s", details.get('status')),
+        ("Aired: %s", airing_text),
+        ("Score: %s/100", details.get('score')),
+        ("Genres: %s", genres and ', '.join(genres)),
+        ("Studios: %s", studios and ', '.join(studios)),
+    )
+    dialog_items.extend(fmt % value for fmt, value in rows if value)
     
     # Description
     if details.get('description'):
         dialog_items.append("\n[COLOR=FF00FF00]Description:[/COLOR]")
         # Split long description into multiple lines
-        import textwrap
-        desc_lines = textwrap.wrap(details['description'], width=80)
-        dialog_items.extend(desc_lines)
+        dialog_items.extend(_wrap_text(details['description'], 80))
     
     # Show dialog
     dialog = xbmcgui.Dialog()
@@ -1033,53 +1193,23 @@ def show_anime_details(anime_id, source='anilist', title=None):
     if selection == -1:  # User cancelled
         return
     
-    selected_item = dialog_items[selection]
-    
-    # Handle actions
-    if selected_item == "View Episodes":
-        xbmc.executebuiltin(f"Container.Update(plugin://{ADDON_ID}/?action=list_episodes&id={anime_id}&source={source}&title={show_title})")
-    
-    elif selected_item == "Play":
-        xbmc.executebuiltin(f"RunPlugin(plugin://{ADDON_ID}/?action=play_item_route&id={anime_id}&source={source}&episode=1")
-    
-    elif selected_item == "Add to Library":
-        LIBRARY.add_to_library(anime_id, source, status="PLANNING")
-        xbmcgui.Dialog().notification("Added to Library", f"{show_title} has been added to your library", xbmcgui.NOTIFICATION_INFO)
-        xbmc.executebuiltin('Container.Refresh')
-    
-    elif selected_item == "Remove from Library":
-        if xbmcgui.Dialog().yesno("Confirm Removal", f"Remove {show_title} from your library?"):
-            LIBRARY.remove_from_library(anime_id, source)
-            xbmcgui.Dialog().notification("Removed from Library", f"{show_title} has been removed from your library", xbmcgui.NOTIFICATION_INFO)
-            xbmc.executebuiltin('Container.Refresh')
-    
-    elif selected_item.startswith("  - ") and in_library:
-        # Status change
-        new_status = None
-        for status_name, status_value in status_options:
-            if selected_item.strip().endswith(status_name):
-                new_status = status_value
-                break
-        
-        if new_status:
-            LIBRARY.add_to_library(anime_id, source, status=new_status)
-            xbmcgui.Dialog().notification("Status Updated", f"Status changed to {new_status.replace('_', ' ').title()}", xbmcgui.NOTIFICATION_INFO)
-            xbmc.executebuiltin('Container.Refresh')
-    
-    elif selected_item in ["Add to Watchlist", "Remove from Watchlist"]:
-        toggle_watchlist(anime_id, source, show_title)
-        xbmc.executebuiltin('Container.Refresh')
+    # Rows past the actions (details, description) do nothing
+    action = actions[selection] if selection < len(actions) else None
+    if action:
+        action()
+
+# View mode ids per content type for Arctic Fuse 2; anything else uses poster view (50)
+_VIEW_MODES = {
+    'tvshows': 55,  # List view for TV shows
+    'episodes': 55,  # List view for episodes
+    'movies': 50,    # Poster view for movies
+}
 
 def set_view_mode(content_type):
     """
     Set the appropriate view mode for Arctic Fuse 2
     """
-    view_mode = {
-        'tvshows': 55,  # List view for TV shows
-        'episodes': 55,  # List view for episodes
-        'movies': 50,    # Poster view for movies
-    }.get(content_type, 50)  # Default to poster view
-    
+    view_mode = _VIEW_MODES.get(content_type, 50)  # Default to poster view
     xbmc.executebuiltin(f'Container.SetViewMode({view_mode})')
 
 # [Rest of the file remains the same...]
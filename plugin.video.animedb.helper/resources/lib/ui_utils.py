@@ -6,18 +6,18 @@ This module contains helper functions for UI-related operations.
 import xbmc
 import xbmcgui
 import xbmcaddon
-from typing import Dict, Any, Optional, List, Tuple
+from typing import AbstractSet, Dict, Any, Optional, List, Tuple
 
 ADDON = xbmcaddon.Addon()
 ADDON_ID = ADDON.getAddonInfo('id')
 
-def get_episode_display_name(episode: Dict[str, Any], watched_episodes: List[int] = None) -> str:
+def get_episode_display_name(episode: Dict[str, Any], watched_episodes: AbstractSet[int] = None) -> str:
     """
     Generate a display name for an episode with progress indicator.
     
     Args:
         episode: Dictionary containing episode details
-        watched_episodes: List of watched episode numbers
+        watched_episodes: Set of watched episode numbers
         
     Returns:
         Formatted episode name with progress indicator
@@ -33,7 +33,7 @@ def get_episode_display_name(episode: Dict[str, Any], watched_episodes: List[int
         return f"✓ {episode_number}. {episode_title}"
     return f"{episode_number}. {episode_title}"
 
-def create_episode_list_item(episode: Dict[str, Any], show_title: str, watched_episodes: List[int] = None,
+def create_episode_list_item(episode: Dict[str, Any], show_title: str, watched_episodes: AbstractSet[int] = None,
                            progress: Optional[float] = None) -> xbmcgui.ListItem:
     """
     Create a list item for an episode with progress indicator.
@@ -41,7 +41,7 @@ def create_episode_list_item(episode: Dict[str, Any], show_title: str, watched_e
     Args:
         episode: Dictionary containing episode details
         show_title: Title of the show
-        watched_episodes: List of watched episode numbers
+        watched_episodes: Set of watched episode numbers
         progress: Optional progress percentage (0-100)
         
     Returns:
@@ -52,7 +52,7 @@ def create_episode_list_item(episode: Dict[str, Any], show_title: str, watched_e
     
     # Create list item with progress indicator
     display_name = get_episode_display_name(episode, watched_episodes)
-    li = xbmcgui.ListItem(display_name)
+    li = xbmcgui.ListItem(display_name, offscreen=True)
     
     # Set additional properties for watched status
     if is_watched:
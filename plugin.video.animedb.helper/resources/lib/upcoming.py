@@ -1,17 +1,36 @@
 import xbmcaddon
 import xbmc
+import threading
 import time
 import datetime
 import os
 import json
 import xbmcvfs
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
-from resources.lib.api import AnimeDBAPI, cached
+from resources.lib.api import AnimeDBAPI, CACHE_DIR, cached
 
 # Get addon instance
 ADDON = xbmcaddon.Addon()
 ADDON_ID = ADDON.getAddonInfo('id')
 
+# Concurrent Trakt next_episode requests in get_trakt_upcoming
+TRAKT_MAX_WORKERS = 8
+
+# Lifetime (seconds) of the upcoming schedule on disk and in memory
+UPCOMING_CACHE_TTL = 3600
+
+# get_calendar buckets airing times into slots of this many seconds
+CALENDAR_SLOT = 15 * 60
+
+# In-process copy of the last schedule so repeat calls skip the disk cache
+_MEMO = {'time': 0, 'data': None}
+_MEMO_LOCK = threading.Lock()
+
+# Shared client for the upcoming fetchers; its requests session pools connections
+API = AnimeDBAPI()
+
 # Logging function
 def log(message, level=xbmc.LOGINFO):
     xbmc.log(f"{ADDON_ID}: {message}", level=level)
@@ -21,33 +40,50 @@ def get_upcoming():
     Get upcoming anime episodes
     """
     def _fetch():
-        api = AnimeDBAPI()
-        
         # Get upcoming episodes from enabled services
-        upcoming = []
+        fetchers = []
         
         if ADDON.getSettingBool('anilist_enabled'):
-            upcoming.extend(get_anilist_upcoming())
+            fetchers.append(get_anilist_upcoming)
         
         if ADDON.getSettingBool('mal_enabled'):
-            upcoming.extend(get_mal_upcoming())
+            fetchers.append(get_mal_upcoming)
         
         if ADDON.getSettingBool('trakt_enabled'):
-            upcoming.extend(get_trakt_upcoming())
+            fetchers.append(get_trakt_upcoming)
+        
+        upcoming = []
+        if fetchers:
+            # The services are independent, so query them concurrently
+            with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+                futures = [executor.submit(fetcher) for fetcher in fetchers]
+                for fetcher, future in zip(fetchers, futures):
+                    try:
+                        upcoming.extend(future.result())
+                    except Exception as e:
+                        log(f"Error in {fetcher.__name__}: {e}", xbmc.LOGWARNING)
         
         # Sort by airing time
         upcoming.sort(key=lambda x: x.get('airing_at', 0))
         
         return upcoming
     
-    return cached('upcoming', _fetch, ttl=3600)  # Cache for 1 hour
+    with _MEMO_LOCK:
+        if _MEMO['data'] is not None and time.time() - _MEMO['time'] < UPCOMING_CACHE_TTL:
+            return _MEMO['data']
+        upcoming = cached('upcoming', _fetch, ttl=UPCOMING_CACHE_TTL)
+        # Age the memo from the disk entry so it never outlives the disk TTL
+        try:
+            _MEMO['time'] = os.path.getmtime(os.path.join(CACHE_DIR, 'upcoming.json'))
+        except OSError:
+            _MEMO['time'] = time.time()
+        _MEMO['data'] = upcoming
+        return upcoming
 
 def get_anilist_upcoming():
     """
     Get upcoming episodes from AniList
     """
-    api = AnimeDBAPI()
-    
     # Get current time
     now = int(time.time())
     
@@ -67,7 +103,7 @@ def get_anilist_upcoming():
       }
     }'''
     
-    data = api._anilist_query(query, {
+    data = API._anilist_query(query, {
         'page': 1,
         'perPage': 50,
         'airingAtGreater': now,
@@ -101,32 +137,42 @@ def get_trakt_upcoming():
     """
     Get upcoming episodes from Trakt
     """
-    api = AnimeDBAPI()
-    
     # Get user's watchlist shows
     watchlist = []
     
     if ADDON.getSettingBool('trakt_enabled'):
-        resp = api._trakt_request('https://api.trakt.tv/users/me/watchlist/shows')
+        resp = API._trakt_request('https://api.trakt.tv/users/me/watchlist/shows')
         
         if resp:
             watchlist = resp.json()
     
     # Get calendar for watchlist shows
     upcoming = []
+    shows = [show for show in watchlist if show.get('show', {}).get('ids', {}).get('trakt')]
     
-    for show in watchlist:
-        show_id = show.get('show', {}).get('ids', {}).get('trakt')
-        
-        if not show_id:
-            continue
-        
-        resp = api._trakt_request(f'https://api.trakt.tv/shows/{show_id}/next_episode')
-        
+    if not shows:
+        return upcoming
+    
+    def _next_episode(show):
+        resp = API._trakt_request(f"https://api.trakt.tv/shows/{show['show']['ids']['trakt']}/next_episode")
         if not resp:
-            continue
-        
-        episode = resp.json()
+            return None
+        try:
+            return resp.json()
+        except ValueError:
+            # 204 No Content when the show has no scheduled episode
+            return None
+    
+    # One request per show; fan them out instead of waiting on each in turn
+    with ThreadPoolExecutor(max_workers=min(TRAKT_MAX_WORKERS, len(shows))) as executor:
+        episodes = list(executor.map(_next_episode, shows))
+    
+    # Only include episodes airing in the next week
+    now = int(time.time())
+    week_later = now + (7 * 24 * 3600)
+    
+    for show, episode in zip(shows, episodes):
+        show_id = show['show']['ids']['trakt']
         
         if not episode:
             continue
@@ -137,16 +183,9 @@ def get_trakt_upcoming():
         if not first_aired:
             continue
         
-        try:
-            airing_at = int(datetime.datetime.fromisoformat(first_aired.replace('Z', '+00:00')).timestamp())
-        except:
-            continue
-        
-        # Only include episodes airing in the next week
-        now = int(time.time())
-        week_later = now + (7 * 24 * 3600)
+        airing_at = _parse_iso_timestamp(first_aired)
         
-        if airing_at < now or airing_at > week_later:
+        if airing_at is None or airing_at < now or airing_at > week_later:
             continue
         
         upcoming.append({
@@ -161,21 +200,34 @@ def get_trakt_upcoming():
     
     return upcoming
 
+@lru_cache(maxsize=256)
+def _parse_iso_timestamp(value):
+    """
+    Convert a Trakt ISO 8601 time to epoch seconds, or None if it can't be parsed.
+    Memoized because shows on the same broadcast slot share air times.
+    """
+    try:
+        return int(datetime.datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp())
+    except (ValueError, TypeError, AttributeError):
+        return None
+
 def get_calendar():
     """
     Get calendar of upcoming anime episodes
     """
     upcoming = get_upcoming()
     
-    # Group by date
+    # Group by local date, formatting each date once per time slot
     calendar = {}
+    dates = {}
     
     for episode in upcoming:
-        date = datetime.datetime.fromtimestamp(episode['airing_at']).strftime('%Y-%m-%d')
-        
-        if date not in calendar:
-            calendar[date] = []
+        # UTC offsets are multiples of 15 minutes, so a slot never spans two local dates
+        slot = episode['airing_at'] // CALENDAR_SLOT
+        date = dates.get(slot)
+        if date is None:
+            date = dates[slot] = datetime.datetime.fromtimestamp(slot * CALENDAR_SLOT).strftime('%Y-%m-%d')
         
-        calendar[date].append(episode)
+        calendar.setdefault(date, []).append(episode)
     
     return calendar
\ No newline at end of file
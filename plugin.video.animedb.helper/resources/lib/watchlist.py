@@ -2,6 +2,7 @@ import xbmcaddon
 import xbmc
 import os
 import json
+import sqlite3
 import xbmcvfs
 
 from resources.lib.api import AnimeDBAPI
@@ -21,35 +22,143 @@ PROFILE = xbmcvfs.translatePath(ADDON.getAddonInfo('profile'))
 WATCHLIST_DIR = os.path.join(PROFILE, 'watchlist')
 os.makedirs(WATCHLIST_DIR, exist_ok=True)
 
+# Watchlist database
+WATCHLIST_DB = os.path.join(WATCHLIST_DIR, 'watchlist.db')
+# Pre-database JSON watchlist, imported into WATCHLIST_DB on first use
+LEGACY_WATCHLIST_FILE = os.path.join(WATCHLIST_DIR, 'watchlist.json')
+_COLUMNS = ('id', 'source', 'title', 'poster', 'banner')
+# Set once the legacy file has been looked for, so only the first connection per process checks
+_legacy_checked = False
+
+# Loaded watchlist and its (id, source) index, keyed by the database file's (mtime_ns, size)
+_WATCHLIST_CACHE = {'stamp': None, 'data': [], 'index': frozenset()}
+
 # Logging function
 def log(message, level=xbmc.LOGINFO):
     xbmc.log(f"{ADDON_ID}: {message}", level=level)
 
-def get_local_watchlist():
+def get_conn():
     """
-    Get local watchlist
+    Get a connection to the watchlist database
     """
-    watchlist_file = os.path.join(WATCHLIST_DIR, 'watchlist.json')
+    global _legacy_checked
+    conn = sqlite3.connect(WATCHLIST_DB)
+    
+    # Create table if it doesn't exist
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS watchlist (
+        id TEXT,
+        source TEXT,
+        title TEXT,
+        poster TEXT,
+        banner TEXT,
+        PRIMARY KEY(id, source)
+    )
+    ''')
     
-    if os.path.exists(watchlist_file):
+    if not _legacy_checked:
+        _legacy_checked = True
+        if os.path.exists(LEGACY_WATCHLIST_FILE):
+            _migrate_legacy_watchlist(conn)
+    
+    return conn
+
+def _row(item):
+    """
+    Database row for a watchlist item
+    """
+    return (
+        str(item.get('id')),
+        item.get('source') or 'anilist',
+        item.get('title', ''),
+        item.get('poster', ''),
+        item.get('banner', '')
+    )
+
+def _migrate_legacy_watchlist(conn):
+    """
+    Import the old watchlist.json once, then set it aside
+    """
+    try:
+        with open(LEGACY_WATCHLIST_FILE, 'r') as f:
+            watchlist = json.load(f)
+        with conn:
+            conn.executemany('INSERT OR IGNORE INTO watchlist VALUES (?, ?, ?, ?, ?)', [_row(item) for item in watchlist])
+        os.replace(LEGACY_WATCHLIST_FILE, f'{LEGACY_WATCHLIST_FILE}.migrated')
+        log(f"Migrated {len(watchlist)} watchlist items to the database")
+    except Exception as e:
+        log(f"Error migrating watchlist: {e}", xbmc.LOGWARNING)
+
+def _file_stamp():
+    """
+    Return the watchlist database's (mtime_ns, size), or None if it doesn't exist
+    """
+    try:
+        st = os.stat(WATCHLIST_DB)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+def _set_cache(stamp, watchlist):
+    """
+    Store a loaded watchlist and its membership index
+    """
+    _WATCHLIST_CACHE['stamp'] = stamp
+    _WATCHLIST_CACHE['data'] = watchlist
+    _WATCHLIST_CACHE['index'] = frozenset((str(item.get('id')), item.get('source', 'anilist')) for item in watchlist)
+
+def _invalidate_cache():
+    """
+    Force the next read to reload from the database
+    """
+    _WATCHLIST_CACHE['stamp'] = None
+
+def _load_watchlist():
+    """
+    Reload the watchlist into the cache only if the database changed since the last read
+    """
+    stamp = _file_stamp()
+    if stamp is not None and stamp == _WATCHLIST_CACHE['stamp']:
+        return
+    watchlist = []
+    # The first read of a process connects even without a database, to pick up a legacy file
+    if stamp is not None or not _legacy_checked:
         try:
-            with open(watchlist_file, 'r') as f:
-                return json.load(f)
+            conn = get_conn()
+            rows = conn.execute('SELECT id, source, title, poster, banner FROM watchlist ORDER BY rowid').fetchall()
+            conn.close()
+            watchlist = [dict(zip(_COLUMNS, row)) for row in rows]
         except Exception as e:
             log(f"Error reading watchlist: {e}", xbmc.LOGWARNING)
-    
-    return []
+    _set_cache(stamp, watchlist)
+
+def get_local_watchlist():
+    """
+    Get local watchlist
+    """
+    _load_watchlist()
+    # Copy so callers can modify the list without touching the cache
+    return list(_WATCHLIST_CACHE['data'])
+
+def get_local_watchlist_set():
+    """
+    Get local watchlist as a frozenset of (str(id), source) pairs for O(1) membership tests
+    """
+    _load_watchlist()
+    return _WATCHLIST_CACHE['index']
 
 def save_local_watchlist(watchlist):
     """
-    Save local watchlist
+    Replace the local watchlist
     """
-    watchlist_file = os.path.join(WATCHLIST_DIR, 'watchlist.json')
-    
     try:
-        with open(watchlist_file, 'w') as f:
-            json.dump(watchlist, f)
+        conn = get_conn()
+        with conn:
+            conn.execute('DELETE FROM watchlist')
+            conn.executemany('INSERT OR IGNORE INTO watchlist VALUES (?, ?, ?, ?, ?)', [_row(item) for item in watchlist])
+        conn.close()
         
+        _invalidate_cache()
         return True
     except Exception as e:
         log(f"Error saving watchlist: {e}", xbmc.LOGERROR)
@@ -59,6 +168,16 @@ def add_to_watchlist(anime_id, source='anilist'):
     """
     Add anime to watchlist
     """
+    # Already in watchlist: skip the details request and the write
+    if is_in_watchlist(anime_id, source):
+        return True
+    
+    return _insert_item(anime_id, source)
+
+def _insert_item(anime_id, source):
+    """
+    Fetch details and insert an anime known not to be in the watchlist
+    """
     # Get anime details
     api = AnimeDBAPI()
     details = api.anime_details(anime_id, source)
@@ -75,53 +194,61 @@ def add_to_watchlist(anime_id, source='anilist'):
         'source': source
     }
     
-    # Get current watchlist
-    watchlist = get_local_watchlist()
-    
-    # Check if already in watchlist
-    for existing in watchlist:
-        if existing.get('id') == anime_id and existing.get('source') == source:
-            return True
-    
-    # Add to watchlist
-    watchlist.append(item)
-    
-    # Save watchlist
-    return save_local_watchlist(watchlist)
+    # Insert just this row
+    try:
+        conn = get_conn()
+        with conn:
+            conn.execute('INSERT OR IGNORE INTO watchlist VALUES (?, ?, ?, ?, ?)', _row(item))
+        conn.close()
+        
+        _invalidate_cache()
+        return True
+    except Exception as e:
+        log(f"Error adding to watchlist: {e}", xbmc.LOGERROR)
+        return False
 
 def remove_from_watchlist(anime_id, source='anilist'):
     """
     Remove anime from watchlist
     """
-    # Get current watchlist
-    watchlist = get_local_watchlist()
-    
-    # Remove from watchlist
-    watchlist = [item for item in watchlist if not (item.get('id') == anime_id and item.get('source') == source)]
+    # Nothing to remove: skip the write
+    if not is_in_watchlist(anime_id, source):
+        return True
     
-    # Save watchlist
-    return save_local_watchlist(watchlist)
+    return _delete_item(anime_id, source)
+
+def _delete_item(anime_id, source):
+    """
+    Delete an anime known to be in the watchlist
+    """
+    # Delete just this row
+    try:
+        conn = get_conn()
+        with conn:
+            conn.execute('DELETE FROM watchlist WHERE id = ? AND source = ?', (str(anime_id), source))
+        conn.close()
+        
+        _invalidate_cache()
+        return True
+    except Exception as e:
+        log(f"Error removing from watchlist: {e}", xbmc.LOGERROR)
+        return False
 
 def is_in_watchlist(anime_id, source='anilist'):
     """
     Check if anime is in watchlist
     """
-    watchlist = get_local_watchlist()
-    
-    for item in watchlist:
-        if item.get('id') == anime_id and item.get('source') == source:
-            return True
-    
-    return False
+    return (str(anime_id), source) in get_local_watchlist_set()
 
 def toggle_watchlist(anime_id, source='anilist'):
     """
     Toggle anime in watchlist
     """
+    # Membership is checked once here rather than again in add/remove
     if is_in_watchlist(anime_id, source):
-        return remove_from_watchlist(anime_id, source)
+        return _delete_item(anime_id, source)
     else:
-        return add_to_watchlist(anime_id, source)
+        return _insert_item(anime_id, source)
 
 def sync_watchlist_to_services():
     """
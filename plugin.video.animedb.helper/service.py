@@ -1,34 +1,66 @@
 try:
     import xbmc
     import xbmcaddon
+    import xbmcvfs
 except ImportError:
-    from resources.lib import xbmc, xbmcaddon
+    from resources.lib import xbmc, xbmcaddon, xbmcvfs
 
+import json
+import os
 import time
 import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 from resources.lib.auth import refresh_token, is_authenticated
-from resources.lib.sync import run_monitor, log_sync_results, SyncManager
+from resources.lib.sync import run_monitor, log_sync_results, sync_manager
 from resources.lib.history import prune_history
 
 # Get addon instance
 ADDON = xbmcaddon.Addon()
 ADDON_ID = ADDON.getAddonInfo('id')
+PROFILE = xbmcvfs.translatePath(ADDON.getAddonInfo('profile'))
+
+# Last-run timestamps persisted so a Kodi restart doesn't redo recent work
+STATE_FILE = os.path.join(PROFILE, 'service_state.json')
+_STATE_KEYS = ('last_sync_time', 'last_token_refresh_time', 'last_history_prune_time')
+
+# Bounds (seconds) for how long the main loop sleeps between checks
+MIN_WAIT = 60
+MAX_WAIT = 300
 
 # Logging helper
 def log(message, level=xbmc.LOGINFO):
     xbmc.log(f"{ADDON_ID} Service: {message}", level=level)
 
-# Initialize SyncManager
-sync_manager = SyncManager()
-
 class AnimeDBMonitor(xbmc.Monitor):
     def __init__(self):
         super().__init__()
         self.last_sync_time = 0
         self.last_token_refresh_time = 0
         self.last_history_prune_time = 0
+        self._load_state()
+
+    def _load_state(self):
+        """Restore the last-run timestamps saved by a previous service run."""
+        try:
+            with open(STATE_FILE, 'r') as f:
+                state = json.load(f)
+            for key in _STATE_KEYS:
+                setattr(self, key, float(state.get(key, 0)))
+        except (OSError, ValueError, TypeError, AttributeError):
+            pass
+
+    def _save_state(self):
+        """Atomically write the last-run timestamps to the profile."""
+        tmp_file = f'{STATE_FILE}.tmp'
+        try:
+            os.makedirs(PROFILE, exist_ok=True)
+            with open(tmp_file, 'w') as f:
+                json.dump({key: getattr(self, key) for key in _STATE_KEYS}, f, separators=(',', ':'))
+            os.replace(tmp_file, STATE_FILE)
+        except OSError as e:
+            log(f"Error saving service state: {e}", xbmc.LOGWARNING)
 
     def onSettingsChanged(self):
         # Handle specific setting changes here
@@ -36,6 +68,8 @@ class AnimeDBMonitor(xbmc.Monitor):
             log("Sync is enabled")
         else:
             log("Sync is disabled")
+        # Apply a newly enabled sync or shortened interval now rather than at the next wake-up
+        self.check_sync()
 
     def check_tokens(self):
         current_time = time.time()
@@ -50,19 +84,44 @@ class AnimeDBMonitor(xbmc.Monitor):
         if ADDON.getSettingBool('trakt_enabled'):
             services.append('trakt')
 
-        for service in services:
-            try:
-                if is_authenticated(service):
-                    log(f"Refreshing {service} token")
-                    if refresh_token(service):
-                        log(f"Successfully refreshed {service} token")
-                    else:
-                        log(f"Failed to refresh {service} token", xbmc.LOGWARNING)
-            except Exception:
-                log(f"Error refreshing {service} token", xbmc.LOGERROR)
-                log(traceback.format_exc(), xbmc.LOGERROR)
+        # Each refresh is an independent HTTPS round-trip, so run them concurrently
+        if services:
+            with ThreadPoolExecutor(max_workers=len(services)) as executor:
+                list(executor.map(self._refresh_service_token, services))
 
         self.last_token_refresh_time = current_time
+        self._save_state()
+
+    def _refresh_service_token(self, service):
+        """Refresh one service's token, logging rather than raising on failure."""
+        try:
+            if is_authenticated(service):
+                log(f"Refreshing {service} token")
+                if refresh_token(service):
+                    log(f"Successfully refreshed {service} token")
+                else:
+                    log(f"Failed to refresh {service} token", xbmc.LOGWARNING)
+        except Exception:
+            log(f"Error refreshing {service} token", xbmc.LOGERROR)
+            log(traceback.format_exc(), xbmc.LOGERROR)
+
+    def _sync_interval(self):
+        """Configured sync interval in seconds."""
+        # sync_interval in hours; default to 6
+        return max(1, int(ADDON.getSetting('sync_interval') or 6)) * 3600
+
+    def seconds_until_next_check(self):
+        """Seconds until the earliest token refresh, sync or prune is due, clamped to the loop bounds."""
+        due = [
+            self.last_token_refresh_time + 86400,
+            self.last_history_prune_time + 86400,
+        ]
+        try:
+            if ADDON.getSettingBool('sync_enabled'):
+                due.append(self.last_sync_time + self._sync_interval())
+        except ValueError:
+            pass
+        return min(MAX_WAIT, max(MIN_WAIT, min(due) - time.time()))
 
     def check_sync(self):
         """Start a sync thread if the configured interval has elapsed."""
@@ -70,15 +129,13 @@ class AnimeDBMonitor(xbmc.Monitor):
             if not ADDON.getSettingBool('sync_enabled'):
                 return
 
-            # sync_interval in hours; default to 6
-            interval_hours = max(1, int(ADDON.getSetting('sync_interval') or 6))
-            interval_secs = interval_hours * 3600
             current_time = time.time()
 
-            if current_time - self.last_sync_time >= interval_secs:
+            if current_time - self.last_sync_time >= self._sync_interval():
                 log(f"Starting scheduled sync (last sync: {time.ctime(self.last_sync_time)})")
                 sync_manager.start_thread(target=self._run_sync, name="SyncThread")
                 self.last_sync_time = current_time
+                self._save_state()
         except Exception:
             log("Error in check_sync", xbmc.LOGERROR)
             log(traceback.format_exc(), xbmc.LOGERROR)
@@ -111,9 +168,11 @@ class AnimeDBMonitor(xbmc.Monitor):
 
             if ADDON.getSettingBool('history_enabled'):
                 log("Pruning watch history")
-                prune_history()
+                # Prune on the sync pool so the monitor loop stays responsive to abort
+                sync_manager.start_thread(target=prune_history, name="PruneThread")
 
             self.last_history_prune_time = current_time
+            self._save_state()
         except Exception:
             log("Error in check_history_prune", xbmc.LOGERROR)
             log(traceback.format_exc(), xbmc.LOGERROR)
@@ -133,8 +192,8 @@ if __name__ == '__main__':
             monitor.check_tokens()
             monitor.check_sync()
             monitor.check_history_prune()
-            # sleep up to 5 minutes, or break early on abort
-            if monitor.waitForAbort(300):
+            # sleep until the next check is due, or break early on abort
+            if monitor.waitForAbort(monitor.seconds_until_next_check()):
                 break
 
         log("Service stopping...")
@@ -0,0 +1,69 @@
+"""
+Load a single resources/lib module outside Kodi.
+
+The package __init__ imports every module, so tests load one file at a time with
+stand-ins for the xbmc* modules and any sibling modules it imports.
+"""
+import importlib.util
+import os
+import sys
+import types
+from unittest import mock
+
+LIB_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'resources', 'lib')
+
+ADDON_ID = 'plugin.video.animedb.helper'
+
+
+def kodi_modules(profile='', settings=None):
+    """
+    Stand-ins for the xbmc* modules; the addon profile is the given directory
+    """
+    settings = settings or {}
+    info = {'id': ADDON_ID, 'path': LIB_DIR, 'profile': profile}
+
+    addon = mock.MagicMock()
+    addon.getAddonInfo.side_effect = lambda key: info.get(key, '')
+    addon.getSetting.side_effect = lambda key: settings.get(key, '')
+
+    xbmcaddon = mock.MagicMock()
+    xbmcaddon.Addon.return_value = addon
+    xbmcvfs = mock.MagicMock()
+    xbmcvfs.translatePath.side_effect = lambda path: path
+    return {
+        'xbmc': mock.MagicMock(),
+        'xbmcaddon': xbmcaddon,
+        'xbmcgui': mock.MagicMock(),
+        'xbmcplugin': mock.MagicMock(),
+        'xbmcvfs': xbmcvfs,
+    }
+
+
+def load_module(name, siblings=(), **kodi):
+    """
+    Import resources/lib/<name>.py as resources.lib.<name>.
+
+    siblings: resources.lib modules replaced with mocks; kodi: kodi_modules() options
+    """
+    modules = kodi_modules(**kodi)
+    for package in ('resources', 'resources.lib'):
+        modules[package] = types.ModuleType(package)
+        modules[package].__path__ = []
+    for sibling in siblings:
+        modules[f'resources.lib.{sibling}'] = mock.MagicMock()
+
+    spec = importlib.util.spec_from_file_location(f'resources.lib.{name}', os.path.join(LIB_DIR, f'{name}.py'))
+    module = importlib.util.module_from_spec(spec)
+    modules[spec.name] = module
+    # Restore only the injected entries, so real dependencies imported on the way stay shared
+    saved = {key: sys.modules.get(key) for key in modules}
+    sys.modules.update(modules)
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        for key, previous in saved.items():
+            if previous is None:
+                del sys.modules[key]
+            else:
+                sys.modules[key] = previous
+    return module
@@ -0,0 +1,36 @@
+import json
+import unittest
+
+from tests.loader import load_module
+
+
+class TestFastParse(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.search = load_module('search', siblings=('api', 'ui'))
+
+    def test_empty_list(self):
+        self.assertEqual(self.search._fast_parse('[]'), [])
+
+    def test_matches_json_dumps_output(self):
+        history = ['naruto', 'one piece', 'attack, on titan']
+        self.assertEqual(self.search._fast_parse(json.dumps(history)), history)
+
+    def test_compact_separator(self):
+        self.assertEqual(self.search._fast_parse('["a","b c"]'), ['a', 'b c'])
+
+    def test_single_item(self):
+        self.assertEqual(self.search._fast_parse('["bleach"]'), ['bleach'])
+
+    def test_escapes_fall_back(self):
+        self.assertIsNone(self.search._fast_parse(json.dumps(['say "hi"'])))
+        self.assertIsNone(self.search._fast_parse(json.dumps(['café'])))
+
+    def test_non_string_lists_fall_back(self):
+        self.assertIsNone(self.search._fast_parse('[1, 2]'))
+        self.assertIsNone(self.search._fast_parse('{"a": "b"}'))
+        self.assertIsNone(self.search._fast_parse(''))
+
+
+if __name__ == '__main__':
+    unittest.main()
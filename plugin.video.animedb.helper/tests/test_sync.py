@@ -0,0 +1,81 @@
+import unittest
+from unittest import mock
+
+from tests.loader import load_module
+
+
+class TestHistorySyncBatch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.sync = load_module('sync', siblings=('api', 'history', 'watchlist'))
+
+    def setUp(self):
+        # Local history: anime 10 episodes 1-12, anime 20 episodes 1-3
+        self.history = [{'anime_id': '10', 'episode': ep} for ep in range(1, 13)]
+        self.history += [{'anime_id': '20', 'episode': ep} for ep in range(1, 4)]
+        patcher = mock.patch.object(self.sync, 'get_watch_history_by_anime', side_effect=self.history_by_anime)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.synced = []
+        sync_history = self.sync.sync_history
+
+        def record(**kwargs):
+            results = sync_history(**kwargs)
+            self.synced.append((kwargs['anime_id'], kwargs['services'], results['synced_items']))
+            return results
+
+        patcher = mock.patch.object(self.sync, 'sync_history', side_effect=record)
+        self.sync_history = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def history_by_anime(self, anime_id, episode=None):
+        return [row for row in self.history
+                if row['anime_id'] == anime_id and (episode is None or row['episode'] == episode)]
+
+    def test_every_episode_of_a_binge_is_synced(self):
+        self.sync._flush_sync_batch([('10', ep, ('mal',)) for ep in range(1, 13)])
+        self.assertEqual(self.synced, [('10', ['mal'], 12)])
+
+    def test_single_episode_syncs_only_that_row(self):
+        self.sync._flush_sync_batch([('10', 5, ('mal',)), ('10', 5, ('mal',))])
+        self.sync_history.assert_called_once_with(services=['mal'], anime_id='10', episode=5, progress=None)
+        self.assertEqual(self.synced, [('10', ['mal'], 1)])
+
+    def test_batches_by_anime_and_services(self):
+        self.sync._flush_sync_batch([
+            ('10', 1, ('mal',)), ('20', 2, ('mal', 'trakt')), ('10', 2, ('mal',)), ('10', None, ('trakt',))
+        ])
+        self.assertEqual(self.synced, [('10', ['mal'], 12), ('20', ['mal', 'trakt'], 2), ('10', ['trakt'], 12)])
+
+
+class TestUpdateWatchStatus(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.sync = load_module('sync', siblings=('api', 'history', 'watchlist'))
+
+    def update(self, settings, source='anilist'):
+        addon = mock.MagicMock()
+        addon.getSettingBool.side_effect = settings.get
+        with mock.patch.object(self.sync, 'ADDON', addon), \
+                mock.patch.object(self.sync, 'record_watch'), \
+                mock.patch.object(self.sync, '_queue_history_sync') as queue_sync:
+            self.assertTrue(self.sync.update_watch_status('10', 3, source=source))
+        return [call[0][0] for call in addon.getSettingBool.call_args_list], queue_sync
+
+    def test_sync_off_reads_only_the_switches(self):
+        read, queue_sync = self.update({'sync_enabled': False})
+        self.assertEqual(read, ['sync_enabled'])
+        read, queue_sync = self.update({'sync_enabled': True, 'sync_history': False})
+        self.assertEqual(read, ['sync_enabled', 'sync_history'])
+        queue_sync.assert_not_called()
+
+    def test_queues_other_enabled_services(self):
+        settings = {'sync_enabled': True, 'sync_history': True,
+                    'anilist_enabled': True, 'mal_enabled': True, 'trakt_enabled': False}
+        read, queue_sync = self.update(settings, source='anilist')
+        queue_sync.assert_called_once_with('10', 3, ['mal'])
+        self.assertNotIn('anilist_enabled', read)
+
+
+if __name__ == '__main__':
+    unittest.main()
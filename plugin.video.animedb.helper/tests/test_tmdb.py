@@ -0,0 +1,150 @@
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from tests.loader import kodi_modules, load_module
+
+
+@unittest.skipIf(importlib.util.find_spec('requests') is None, 'requests is not installed')
+class TestTTLCached(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmdb = load_module('tmdb')
+
+    def setUp(self):
+        self.tmdb._CACHE.clear()
+        self.calls = []
+        self.release = threading.Event()
+        test = self
+
+        class Client:
+            api_key = 'key'
+
+            @self.tmdb.ttl_cached
+            def search_tv(self, query):
+                test.calls.append(query)
+                test.release.wait(5)
+                if query == 'fail':
+                    raise ValueError(query)
+                return [query]
+
+        self.client = Client()
+
+    def test_result_is_cached_per_arguments(self):
+        self.release.set()
+        self.assertEqual(self.client.search_tv('a'), ['a'])
+        self.assertIs(self.client.search_tv('a'), self.client.search_tv('a'))
+        self.client.search_tv('b')
+        self.assertEqual(self.calls, ['a', 'b'])
+
+    def test_expired_entry_is_refetched(self):
+        self.release.set()
+        self.client.search_tv('a')
+        key = ('search_tv', 'key', 'a')
+        self.tmdb._CACHE[key] = (time.time() - 1, self.tmdb._CACHE[key][1])
+        self.client.search_tv('a')
+        self.assertEqual(self.calls, ['a', 'a'])
+
+    def test_concurrent_misses_share_one_request(self):
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.client.search_tv('a'))) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        while 'a' not in self.calls:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        self.release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(self.calls, ['a'])
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(self.tmdb._INFLIGHT, {})
+
+    def test_errors_reach_waiters_and_are_not_cached(self):
+        errors = []
+
+        def search():
+            try:
+                self.client.search_tv('fail')
+            except ValueError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=search) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        while 'fail' not in self.calls:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        self.release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(len(errors), 3)
+        self.assertEqual(self.calls, ['fail'])
+        self.assertEqual(self.tmdb._INFLIGHT, {})
+        with self.assertRaises(ValueError):
+            self.client.search_tv('fail')
+        self.assertEqual(self.calls, ['fail', 'fail'])
+
+
+@unittest.skipIf(importlib.util.find_spec('requests') is None, 'requests is not installed')
+class TestTVDetailsCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmdb = load_module('tmdb')
+
+    def setUp(self):
+        self.tmdb._CACHE.clear()
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        self.cache_file = os.path.join(cache_dir, 'tv_1.json')
+        for patcher in (mock.patch.object(self.tmdb, '_cache_file', return_value=self.cache_file),
+                        mock.patch.dict(sys.modules, kodi_modules())):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.client = self.tmdb.TMDBAPI('key')
+        self.client._session = mock.MagicMock()
+
+    def write_expired(self):
+        with open(self.cache_file, 'w') as f:
+            json.dump({'etag': '"v1"', 'data': {'name': 'Cached'}}, f)
+        expired = time.time() - self.tmdb.DETAILS_CACHE_TTL - 60
+        os.utime(self.cache_file, (expired, expired))
+
+    def test_expired_copy_survives_outage(self):
+        self.write_expired()
+        import requests
+        self.client._session.get.side_effect = requests.ConnectionError('down')
+        self.assertEqual(self.client.get_tv_details(1), {'name': 'Cached'})
+
+    def test_expired_copy_survives_server_error(self):
+        self.write_expired()
+        resp = self.client._session.get.return_value
+        resp.status_code = 503
+        import requests
+        resp.raise_for_status.side_effect = requests.HTTPError('503')
+        self.assertEqual(self.client.get_tv_details(1), {'name': 'Cached'})
+
+    def test_not_modified_tolerates_deleted_file(self):
+        self.write_expired()
+        self.client._session.get.return_value.status_code = 304
+        with mock.patch.object(self.tmdb.os, 'utime', side_effect=FileNotFoundError):
+            self.assertEqual(self.client.get_tv_details(1), {'name': 'Cached'})
+        self.assertEqual(self.client._session.get.call_args[1]['headers'], {'If-None-Match': '"v1"'})
+
+    def test_outage_without_cache_raises(self):
+        import requests
+        self.client._session.get.side_effect = requests.ConnectionError('down')
+        with self.assertRaises(requests.ConnectionError):
+            self.client.get_tv_details(1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from datetime import datetime
+
+from tests.loader import load_module
+
+
+class TestWrapText(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ui = load_module('ui', siblings=('api', 'fanart', 'history', 'watchlist'))
+
+    def test_wraps_at_width(self):
+        self.assertEqual(self.ui._wrap_text('one two three four', 9), ('one two', 'three', 'four'))
+
+    def test_line_may_fill_width_exactly(self):
+        self.assertEqual(self.ui._wrap_text('abc def', 7), ('abc def',))
+
+    def test_long_word_gets_its_own_line(self):
+        self.assertEqual(self.ui._wrap_text('a abcdefghij b', 5), ('a', 'abcdefghij', 'b'))
+
+    def test_whitespace_is_collapsed(self):
+        self.assertEqual(self.ui._wrap_text('  a\n\tb   c  ', 80), ('a b c',))
+
+    def test_empty_text(self):
+        self.assertEqual(self.ui._wrap_text(''), ())
+        self.assertEqual(self.ui._wrap_text('   '), ())
+
+
+class TestMenus(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ui = load_module('ui', siblings=('api', 'fanart', 'history', 'watchlist'))
+
+    def setUp(self):
+        self.ui.xbmcplugin.reset_mock()
+
+    def assert_one_batch(self, count):
+        self.ui.xbmcplugin.addDirectoryItem.assert_not_called()
+        self.ui.xbmcplugin.addDirectoryItems.assert_called_once()
+        handle, items, total = self.ui.xbmcplugin.addDirectoryItems.call_args[0]
+        self.assertEqual(handle, 1)
+        self.assertEqual((len(items), total), (count, count))
+        return items
+
+    def test_home(self):
+        self.ui.home(1)
+        items = self.assert_one_batch(len(self.ui._HOME_ITEMS))
+        self.assertTrue(items[0][0].endswith('action=continue_watching'))
+
+    def test_season_selector(self):
+        self.ui.add_season_selector(1, datetime.now().year, 'spring', 'anilist')
+        # Previous/next season plus the last five years minus the current season
+        items = self.assert_one_batch(2 + 5 * 4 - 1)
+        self.assertIn('season=WINTER', items[0][0])
+        self.assertIn('season=SUMMER', items[1][0])
+
+    def test_source_selector(self):
+        self.ui.add_source_selector(1, 'trending', 2, 'mal')
+        items = self.assert_one_batch(2)
+        self.assertEqual([url.rsplit('source=', 1)[1] for url, li, is_folder in items], ['anilist', 'trakt'])
+
+
+if __name__ == '__main__':
+    unittest.main()
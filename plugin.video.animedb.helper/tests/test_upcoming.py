@@ -0,0 +1,39 @@
+import datetime
+import time
+import unittest
+from unittest import mock
+
+from tests.loader import load_module
+
+
+class TestCalendar(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.upcoming = load_module('upcoming', siblings=('api',))
+
+    def calendar(self, times):
+        episodes = [{'id': str(i), 'airing_at': t} for i, t in enumerate(times)]
+        with mock.patch.object(self.upcoming, 'get_upcoming', return_value=episodes):
+            return self.upcoming.get_calendar()
+
+    def test_dates_match_each_airing_time(self):
+        midnight = int(time.mktime(datetime.date(2024, 4, 10).timetuple()))
+        times = [midnight - 1, midnight, midnight + 60, midnight + 899, midnight + 900, midnight + 86399]
+        calendar = self.calendar(times)
+        for date, episodes in calendar.items():
+            for episode in episodes:
+                self.assertEqual(datetime.datetime.fromtimestamp(episode['airing_at']).strftime('%Y-%m-%d'), date)
+        self.assertEqual(sorted(calendar), ['2024-04-09', '2024-04-10'])
+        self.assertEqual(len(calendar['2024-04-10']), 5)
+
+    def test_episodes_keep_their_order(self):
+        midnight = int(time.mktime(datetime.date(2024, 4, 10).timetuple()))
+        calendar = self.calendar([midnight + 3600, midnight + 100, midnight + 7200])
+        self.assertEqual([e['id'] for e in calendar['2024-04-10']], ['0', '1', '2'])
+
+    def test_empty(self):
+        self.assertEqual(self.calendar([]), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from tests.loader import load_module
+
+
+class TestWatchlist(unittest.TestCase):
+    def setUp(self):
+        self.profile = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.profile)
+
+    def load(self):
+        watchlist = load_module('watchlist', siblings=('api',), profile=self.profile)
+        watchlist.AnimeDBAPI.return_value.anime_details.side_effect = lambda anime_id, source: {
+            'title': f'Anime {anime_id}', 'poster': 'poster.jpg', 'banner': 'banner.jpg'
+        }
+        return watchlist
+
+    def write_legacy(self, items):
+        os.makedirs(os.path.join(self.profile, 'watchlist'), exist_ok=True)
+        with open(os.path.join(self.profile, 'watchlist', 'watchlist.json'), 'w') as f:
+            json.dump(items, f)
+
+    def test_add_remove_round_trip(self):
+        watchlist = self.load()
+        self.assertEqual(watchlist.get_local_watchlist(), [])
+        self.assertTrue(watchlist.add_to_watchlist(1, 'anilist'))
+        self.assertTrue(watchlist.is_in_watchlist(1, 'anilist'))
+        self.assertEqual(watchlist.get_local_watchlist(), [
+            {'id': '1', 'source': 'anilist', 'title': 'Anime 1', 'poster': 'poster.jpg', 'banner': 'banner.jpg'}
+        ])
+        self.assertTrue(watchlist.remove_from_watchlist(1, 'anilist'))
+        self.assertFalse(watchlist.is_in_watchlist(1, 'anilist'))
+        self.assertEqual(watchlist.get_local_watchlist(), [])
+
+    def test_add_existing_skips_details_request(self):
+        watchlist = self.load()
+        watchlist.add_to_watchlist(1)
+        watchlist.add_to_watchlist(1)
+        self.assertEqual(watchlist.AnimeDBAPI.return_value.anime_details.call_count, 1)
+        self.assertEqual(len(watchlist.get_local_watchlist()), 1)
+
+    def test_toggle(self):
+        watchlist = self.load()
+        self.assertTrue(watchlist.toggle_watchlist(5, 'mal'))
+        self.assertTrue(watchlist.is_in_watchlist(5, 'mal'))
+        self.assertTrue(watchlist.toggle_watchlist(5, 'mal'))
+        self.assertFalse(watchlist.is_in_watchlist(5, 'mal'))
+
+    def test_ids_are_normalised_to_strings_per_source(self):
+        watchlist = self.load()
+        watchlist.add_to_watchlist(7, 'anilist')
+        self.assertTrue(watchlist.is_in_watchlist('7', 'anilist'))
+        self.assertTrue(watchlist.is_in_watchlist(7, 'anilist'))
+        self.assertFalse(watchlist.is_in_watchlist(7, 'mal'))
+        self.assertEqual(watchlist.get_local_watchlist_set(), frozenset({('7', 'anilist')}))
+        watchlist.toggle_watchlist('7', 'anilist')
+        self.assertEqual(watchlist.get_local_watchlist_set(), frozenset())
+
+    def test_legacy_json_is_migrated_once(self):
+        self.write_legacy([
+            {'id': 3, 'source': 'anilist', 'title': 'Three'},
+            {'id': '4', 'source': 'mal', 'title': 'Four', 'poster': 'p.jpg', 'banner': 'b.jpg'},
+        ])
+        watchlist = self.load()
+        self.assertEqual(watchlist.get_local_watchlist_set(), frozenset({('3', 'anilist'), ('4', 'mal')}))
+        self.assertEqual(watchlist.get_local_watchlist()[1]['poster'], 'p.jpg')
+        self.assertFalse(os.path.exists(watchlist.LEGACY_WATCHLIST_FILE))
+        self.assertTrue(os.path.exists(f'{watchlist.LEGACY_WATCHLIST_FILE}.migrated'))
+
+        # A file appearing later in the same process is not looked for again
+        self.write_legacy([{'id': 9, 'source': 'anilist'}])
+        watchlist.remove_from_watchlist(3, 'anilist')
+        self.assertEqual(watchlist.get_local_watchlist_set(), frozenset({('4', 'mal')}))
+        self.assertTrue(os.path.exists(watchlist.LEGACY_WATCHLIST_FILE))
+
+
+if __name__ == '__main__':
+    unittest.main()